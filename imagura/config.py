@@ -16,6 +16,11 @@ LANGUAGE = "ru"
 # Performance
 TARGET_FPS = 120
 ASYNC_WORKERS = 10
+# Keep drawing this long after the last input or UI event; once nothing is
+# animating, later frames are skipped until something changes.
+REDRAW_SETTLE_SECONDS = 1.0
+# Per-frame time budget for async callbacks (texture uploads) on the UI thread.
+UI_EVENT_BUDGET_MS = 4.0
 
 # Animation durations (milliseconds)
 ANIM_SWITCH_KEYS_MS = 250
@@ -73,6 +78,7 @@ GALLERY_SETTLE_DEBOUNCE_S = 0.12
 
 # Thumbnails
 THUMB_CACHE_LIMIT = 400
+THUMB_CACHE_MAX_MB = 64  # GPU memory cap for gallery thumbnails
 THUMB_CACHE_DIR = ".imagura_cache"
 THUMB_PADDING = 6
 THUMB_PRELOAD_SPAN = 40
@@ -91,6 +97,8 @@ FONT_SIZE = 32
 FONT_DISPLAY_SIZE = 28
 FONT_ANTIALIAS = True
 SHOW_SCALE_OVERLAY = True
+# Soft drop shadow behind overlay text (~110 extra text draws per string)
+TEXT_SHADOW = True
 
 # Hotkeys (raylib key codes)
 # See: https://github.com/raysan5/raylib/blob/master/src/raylib.h
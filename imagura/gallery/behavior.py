@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any, Callable
 
 from .. import config as cfg
-from ..math_utils import clamp
+from ..math_utils import approach, clamp
 
 
 class GalleryBehavior:
@@ -78,20 +78,15 @@ class GalleryBehavior:
         want_show = force_visible or in_trigger or in_panel
         state.gallery_visible = want_show
 
-        current_y = state.gallery_y
         target_y = y_visible if want_show else y_hidden
         slide_ms = cfg.GALLERY_SLIDE_MS
 
-        if slide_ms <= 0:
+        if slide_ms <= 0 or state.gallery_y == target_y:
             state.gallery_y = target_y
             return
 
         speed = gallery_height / (slide_ms / 1000.0)
-        step = speed * frame_dt
-        if abs(current_y - target_y) <= step:
-            state.gallery_y = target_y
-        else:
-            state.gallery_y = current_y - step if current_y > target_y else current_y + step
+        state.gallery_y = approach(state.gallery_y, target_y, speed * frame_dt)
 
     def is_mouse_over(self, state: Any, mouse_y: float, gallery_height: int) -> bool:
         y_visible = state.screenH - gallery_height
@@ -14,6 +14,20 @@ from ..rl_compat import rl, make_color as RL_Color, make_rect as RL_Rect, make_v
 class GalleryRenderer:
     """Draws gallery state. It does not navigate by itself."""
 
+    def __init__(self) -> None:
+        # Thumbs are drawn whole with no rotation, so the origin is constant
+        # and the source rect depends only on the thumb size.
+        self._origin = RL_V2(0, 0)
+        self._src_rects: dict = {}
+
+    def _src_rect(self, size):
+        rect = self._src_rects.get(size)
+        if rect is None:
+            if len(self._src_rects) >= 256:
+                self._src_rects.clear()
+            rect = self._src_rects[size] = RL_Rect(0, 0, size[0], size[1])
+        return rect
+
     def render(
         self,
         state: Any,
@@ -49,38 +63,52 @@ class GalleryRenderer:
         offset_adjust = 0.0
         if center_frac > 0 and center_int + 1 in thumb_positions and center_int in thumb_positions:
             offset_adjust = lerp(thumb_positions[center_int], thumb_positions[center_int + 1], center_frac)
+        # Positions are whole pixels; snap the scroll once so every thumb x is int math.
+        origin_x = center_x - int(offset_adjust)
+
+        # Loop invariants bound once; the body runs for every visible thumb.
+        images = state.current_dir_images
+        thumb_cache = state.thumb_cache
+        center_index = state.gallery_center_index
+        current_index = state.index
+        min_scale = cfg.GALLERY_MIN_SCALE
+        min_alpha = cfg.GALLERY_MIN_ALPHA
 
         clicked_index = None
+        # Positions grow left to right, so thumbs past the right edge end the loop.
         for idx in range(start_idx, end_idx + 1):
             if idx not in thumb_positions:
                 continue
 
-            path = state.current_dir_images[idx]
-            thumb = state.thumb_cache.get(path)
-            distance = abs(idx - state.gallery_center_index)
-            scale_factor = lerp(1.0, cfg.GALLERY_MIN_SCALE, min(1.0, distance / visible_range))
-            alpha_factor = lerp(1.0, cfg.GALLERY_MIN_ALPHA, min(1.0, distance / visible_range))
+            path = images[idx]
+            thumb = thumb_cache.get(path)
+            falloff = min(1.0, abs(idx - center_index) / visible_range)
+            scale_factor = lerp(1.0, min_scale, falloff)
+            alpha_factor = lerp(1.0, min_alpha, falloff)
 
-            thumb_center_x = center_x + int(thumb_positions[idx] - offset_adjust)
+            thumb_center_x = origin_x + thumb_positions[idx]
             if thumb and thumb.ready and thumb.texture and getattr(thumb.texture, "id", 0) and thumb.size[1] > 0:
                 fit_scale = base_thumb_h / thumb.size[1]
                 total_scale = fit_scale * scale_factor
                 scaled_w = int(thumb.size[0] * total_scale)
                 scaled_h = int(thumb.size[1] * total_scale)
                 thumb_x = thumb_center_x - scaled_w // 2
+                if thumb_x + scaled_w < 0:
+                    continue
+                if thumb_x > screen_w:
+                    break
                 thumb_y = y + (gallery_height - scaled_h) // 2
                 is_hover = thumb_x <= mouse_x <= thumb_x + scaled_w and thumb_y <= mouse_y <= thumb_y + scaled_h
                 final_alpha = 1.0 if is_hover else alpha_factor
 
                 try:
-                    src_rect = RL_Rect(0, 0, thumb.size[0], thumb.size[1])
                     dst_rect = RL_Rect(thumb_x, thumb_y, scaled_w, scaled_h)
                     tint = RL_Color(255, 255, 255, int(255 * final_alpha * alpha_panel))
-                    rl.DrawTexturePro(thumb.texture, src_rect, dst_rect, RL_V2(0, 0), 0.0, tint)
+                    rl.DrawTexturePro(thumb.texture, self._src_rect(thumb.size), dst_rect, self._origin, 0.0, tint)
                 except Exception as exc:
                     log(f"[DRAW][THUMB][ERR] {os.path.basename(path)}: {exc!r}")
 
-                if idx == state.index:
+                if idx == current_index:
                     rl.DrawRectangleLines(
                         thumb_x - 2,
                         thumb_y - 2,
@@ -91,10 +119,16 @@ class GalleryRenderer:
 
                 if is_hover and left_clicked:
                     clicked_index = idx
+
+                thumb_cache.move_to_end(path)
             else:
                 scaled_w = int(base_thumb_h * 1.4 * scale_factor)
                 scaled_h = int(base_thumb_h * scale_factor)
                 thumb_x = thumb_center_x - scaled_w // 2
+                if thumb_x + scaled_w < 0:
+                    continue
+                if thumb_x > screen_w:
+                    break
                 thumb_y = y + (gallery_height - scaled_h) // 2
                 rl.DrawRectangle(
                     thumb_x,
@@ -107,30 +141,32 @@ class GalleryRenderer:
         return clicked_index
 
     def _compute_thumb_positions(self, state: Any, start_idx: int, end_idx: int, base_thumb_h: int, visible_range: int):
+        # Each width feeds two neighbouring gaps; measure it once per frame.
+        images = state.current_dir_images
+        thumb_cache = state.thumb_cache
+        center_index = state.gallery_center_index
+        widths = {
+            idx: self._thumb_width(thumb_cache.get(images[idx]), abs(idx - center_index), base_thumb_h, visible_range)
+            for idx in range(start_idx, end_idx + 1)
+        }
         thumb_positions = {}
         center_idx = int(state.gallery_center_index)
-        thumb_positions[center_idx] = 0.0
+        thumb_positions[center_idx] = 0
+        spacing = int(cfg.GALLERY_THUMB_SPACING)
 
-        cumulative_offset = 0.0
+        cumulative_offset = 0
         for idx in range(center_idx - 1, start_idx - 1, -1):
-            current_w = self._thumb_width(state, idx, base_thumb_h, visible_range)
-            next_w = self._thumb_width(state, idx + 1, base_thumb_h, visible_range)
-            cumulative_offset -= current_w / 2.0 + cfg.GALLERY_THUMB_SPACING + next_w / 2.0
+            cumulative_offset -= (widths[idx] + widths[idx + 1]) // 2 + spacing
             thumb_positions[idx] = cumulative_offset
 
-        cumulative_offset = 0.0
+        cumulative_offset = 0
         for idx in range(center_idx + 1, end_idx + 1):
-            prev_w = self._thumb_width(state, idx - 1, base_thumb_h, visible_range)
-            current_w = self._thumb_width(state, idx, base_thumb_h, visible_range)
-            cumulative_offset += prev_w / 2.0 + cfg.GALLERY_THUMB_SPACING + current_w / 2.0
+            cumulative_offset += (widths[idx - 1] + widths[idx]) // 2 + spacing
             thumb_positions[idx] = cumulative_offset
 
         return thumb_positions
 
-    def _thumb_width(self, state: Any, idx: int, base_thumb_h: int, visible_range: int) -> int:
-        path = state.current_dir_images[idx]
-        thumb = state.thumb_cache.get(path)
-        distance = abs(idx - state.gallery_center_index)
+    def _thumb_width(self, thumb: Any, distance: float, base_thumb_h: int, visible_range: int) -> int:
         scale_factor = lerp(1.0, cfg.GALLERY_MIN_SCALE, min(1.0, distance / visible_range))
         if thumb and thumb.ready and thumb.texture and thumb.size[1] > 0:
             fit_scale = base_thumb_h / thumb.size[1]
@@ -62,6 +62,7 @@ STRINGS: dict[str, dict[str, str]] = {
     "fld.close_btn_margin": {"ru": "Отступ от края", "en": "Edge margin"},
     "hdr.overlays": {"ru": "Оверлеи", "en": "Overlays"},
     "fld.show_scale_overlay": {"ru": "Индикатор масштаба", "en": "Scale indicator"},
+    "fld.text_shadow": {"ru": "Тень под текстом", "en": "Text shadow"},
     "hdr.background": {"ru": "Фон", "en": "Background"},
     "fld.blur": {"ru": "Размытие фона", "en": "Background blur"},
 
@@ -74,6 +75,7 @@ STRINGS: dict[str, dict[str, str]] = {
     "fld.gallery_min_alpha": {"ru": "Мин. прозрачность", "en": "Min opacity"},
     "hdr.thumbnails": {"ru": "Миниатюры", "en": "Thumbnails"},
     "fld.thumb_cache_limit": {"ru": "Лимит кэша", "en": "Cache limit"},
+    "fld.thumb_cache_mb": {"ru": "Кэш миниатюр (МБ)", "en": "Cache size (MB)"},
     "fld.thumb_padding": {"ru": "Отступ внутри", "en": "Inner padding"},
     "fld.thumb_preload": {"ru": "Предзагрузка", "en": "Preload span"},
 
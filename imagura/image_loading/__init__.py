@@ -1,6 +1,6 @@
 """Image loading orchestration."""
 
-from .content_loader import load_content_cpu
+from .content_loader import load_content_cpu, load_content_thumbnail_cpu
 from .current_and_neighbors import CurrentAndNeighborLoader
 
-__all__ = ["CurrentAndNeighborLoader", "load_content_cpu"]
+__all__ = ["CurrentAndNeighborLoader", "load_content_cpu", "load_content_thumbnail_cpu"]
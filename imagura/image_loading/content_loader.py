@@ -7,9 +7,20 @@ import os
 from ..viewers import get_registry
 
 
-def load_content_cpu(path: str):
-    """Load file via the appropriate viewer. Returns (viewer, cpu_data)."""
+def _viewer_for(path: str):
     viewer = get_registry().get_viewer(path)
     if viewer is None:
         raise RuntimeError(f"No viewer for {os.path.splitext(path)[1]}")
+    return viewer
+
+
+def load_content_cpu(path: str):
+    """Load file via the appropriate viewer. Returns (viewer, cpu_data)."""
+    viewer = _viewer_for(path)
     return (viewer, viewer.load_cpu(path))
+
+
+def load_content_thumbnail_cpu(path: str, target_h: int):
+    """Like load_content_cpu, but lets the viewer decode at thumbnail scale."""
+    viewer = _viewer_for(path)
+    return (viewer, viewer.load_cpu_thumbnail(path, target_h))
@@ -37,12 +37,13 @@ class CurrentAndNeighborLoader:
         self.animated_content_cache = animated_content_cache
 
     def preload(self, state: Any, new_index: int, skip_neighbors: bool = False) -> None:
-        n = len(state.current_dir_images)
+        images = state.current_dir_images
+        n = len(images)
         if n == 0:
             return
 
         new_index = clamp(new_index, 0, n - 1)
-        current_path = state.current_dir_images[new_index]
+        current_path = images[new_index]
         old_index = state.index
         state.index = new_index
 
@@ -87,8 +88,8 @@ class CurrentAndNeighborLoader:
             log("[PRELOAD] Skipping neighbors/thumbs during animation")
             return
 
-        expected_prev_path = state.current_dir_images[new_index - 1] if new_index - 1 >= 0 else None
-        expected_next_path = state.current_dir_images[new_index + 1] if new_index + 1 < n else None
+        expected_prev_path = images[new_index - 1] if new_index - 1 >= 0 else None
+        expected_next_path = images[new_index + 1] if new_index + 1 < n else None
         neighbor_callback = self._neighbor_loaded_callback(state, generation, expected_prev_path, expected_next_path)
 
         if expected_prev_path:
@@ -1,5 +1,5 @@
 """Image metadata readers and caches."""
 
-from .exif_cache import ExifMetadataCache, get_image_metadata
+from .exif_cache import ExifMetadataCache, get_image_metadata, peek_image_metadata, request_image_metadata
 
-__all__ = ["ExifMetadataCache", "get_image_metadata"]
+__all__ = ["ExifMetadataCache", "get_image_metadata", "peek_image_metadata", "request_image_metadata"]
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Set
 
 from ..logging import log
+from ..types import LoadPriority
 
 try:
     from PIL import Image
-    from PIL.ExifTags import TAGS
 
     HAS_PIL = True
 except ImportError:
@@ -23,21 +23,50 @@ class ExifMetadataCache:
     def __init__(self, limit: int = 500):
         self.limit = max(1, int(limit))
         self._cache: OrderedDict[str, Dict[str, str]] = OrderedDict()
+        self._pending: Set[str] = set()
 
     def get(self, filepath: str) -> Dict[str, str]:
-        if filepath in self._cache:
-            self._cache.move_to_end(filepath)
-            return self._cache[filepath]
+        hit = self.peek(filepath)
+        if hit is not None:
+            return hit
 
         metadata = self._read_uncached(filepath)
-        self._cache[filepath] = metadata
-        while len(self._cache) > self.limit:
-            self._cache.popitem(last=False)
+        self._store(filepath, metadata)
         return metadata
 
+    def peek(self, filepath: str) -> Optional[Dict[str, str]]:
+        """Return cached metadata without touching the file, or None."""
+        hit = self._cache.get(filepath)
+        if hit is not None:
+            self._cache.move_to_end(filepath)
+        return hit
+
+    def request(self, filepath: str, loader, on_ready: Optional[Callable[[str], None]] = None) -> None:
+        """Read ``filepath`` on an async loader worker and cache the result.
+
+        ``on_ready(path)`` runs on the UI thread once the metadata is cached.
+        Repeated requests for a path already in flight are ignored.
+        """
+        if filepath in self._pending or filepath in self._cache:
+            return
+        self._pending.add(filepath)
+
+        def on_loaded(path: str, metadata, error) -> None:
+            self._pending.discard(path)
+            self._store(path, metadata if error is None and metadata is not None else {})
+            if on_ready is not None:
+                on_ready(path)
+
+        loader.submit(filepath, LoadPriority.METADATA, on_loaded, load=self._read_uncached)
+
     def cached_paths(self) -> List[str]:
         return list(self._cache.keys())
 
+    def _store(self, filepath: str, metadata: Dict[str, str]) -> None:
+        self._cache[filepath] = metadata
+        while len(self._cache) > self.limit:
+            self._cache.popitem(last=False)
+
     def _read_uncached(self, filepath: str) -> Dict[str, str]:
         metadata: Dict[str, str] = {}
         if not HAS_PIL:
@@ -45,37 +74,71 @@ class ExifMetadataCache:
 
         try:
             with Image.open(filepath) as img:
-                exif_data = img._getexif()
-                if not exif_data:
+                exif = img.getexif()
+                if not exif:
                     return metadata
 
-                for tag_id, value in exif_data.items():
-                    tag_name = TAGS.get(tag_id, str(tag_id))
-                    self._apply_metadata_value(metadata, tag_name, value)
+                # Look up only the wanted ids; the Exif sub-IFD is parsed on
+                # demand and the rest of the tags are never materialized.
+                _apply_tags(metadata, exif, _IFD0_HANDLERS)
+                _apply_tags(metadata, exif.get_ifd(_EXIF_IFD), _EXIF_IFD_HANDLERS)
         except Exception as exc:
             log(f"[METADATA] Error reading EXIF from {filepath}: {exc}")
 
         return metadata
 
-    def _apply_metadata_value(self, metadata: Dict[str, str], tag_name: str, value) -> None:
-        if tag_name == "DateTimeOriginal":
-            try:
-                dt = datetime.strptime(str(value), "%Y:%m:%d %H:%M:%S")
-                metadata["date"] = dt.strftime("%Y-%m-%d %H:%M")
-            except (ValueError, TypeError):
-                metadata["date"] = str(value)
-        elif tag_name == "Model":
-            metadata["camera"] = str(value).strip()
-        elif tag_name == "FocalLength":
-            metadata["focal"] = f"{_ratio_to_float(value):.0f}mm" if _is_ratio(value) else f"{value}mm"
-        elif tag_name == "FNumber":
-            metadata["aperture"] = f"f/{_ratio_to_float(value):.1f}" if _is_ratio(value) else f"f/{value}"
-        elif tag_name == "ISOSpeedRatings":
-            metadata["iso"] = f"ISO {value}"
-        elif tag_name == "ExposureTime":
-            exposure = _format_exposure(value)
-            if exposure:
-                metadata["exposure"] = exposure
+
+def _set_date(metadata: Dict[str, str], value) -> None:
+    try:
+        dt = datetime.strptime(str(value), "%Y:%m:%d %H:%M:%S")
+        metadata["date"] = dt.strftime("%Y-%m-%d %H:%M")
+    except (ValueError, TypeError):
+        metadata["date"] = str(value)
+
+
+def _set_camera(metadata: Dict[str, str], value) -> None:
+    metadata["camera"] = str(value).strip()
+
+
+def _set_focal(metadata: Dict[str, str], value) -> None:
+    metadata["focal"] = f"{_ratio_to_float(value):.0f}mm" if _is_ratio(value) else f"{value}mm"
+
+
+def _set_aperture(metadata: Dict[str, str], value) -> None:
+    metadata["aperture"] = f"f/{_ratio_to_float(value):.1f}" if _is_ratio(value) else f"f/{value}"
+
+
+def _set_iso(metadata: Dict[str, str], value) -> None:
+    metadata["iso"] = f"ISO {value}"
+
+
+def _set_exposure(metadata: Dict[str, str], value) -> None:
+    exposure = _format_exposure(value)
+    if exposure:
+        metadata["exposure"] = exposure
+
+
+_EXIF_IFD = 0x8769
+
+# Numeric tag ids per IFD: Model lives in IFD0, the capture settings in the
+# Exif sub-IFD.
+_IFD0_HANDLERS: Dict[int, Callable[[Dict[str, str], object], None]] = {
+    0x0110: _set_camera,      # Model
+}
+_EXIF_IFD_HANDLERS: Dict[int, Callable[[Dict[str, str], object], None]] = {
+    0x9003: _set_date,        # DateTimeOriginal
+    0x920A: _set_focal,       # FocalLength
+    0x829D: _set_aperture,    # FNumber
+    0x8827: _set_iso,         # ISOSpeedRatings
+    0x829A: _set_exposure,    # ExposureTime
+}
+
+
+def _apply_tags(metadata: Dict[str, str], tags, handlers) -> None:
+    for tag_id, handler in handlers.items():
+        value = tags.get(tag_id)
+        if value is not None:
+            handler(metadata, value)
 
 
 def _is_ratio(value) -> bool:
@@ -101,3 +164,11 @@ _DEFAULT_CACHE = ExifMetadataCache()
 
 def get_image_metadata(filepath: str) -> Dict[str, str]:
     return _DEFAULT_CACHE.get(filepath)
+
+
+def peek_image_metadata(filepath: str) -> Optional[Dict[str, str]]:
+    return _DEFAULT_CACHE.peek(filepath)
+
+
+def request_image_metadata(filepath: str, loader, on_ready: Optional[Callable[[str], None]] = None) -> None:
+    _DEFAULT_CACHE.request(filepath, loader, on_ready)
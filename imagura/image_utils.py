@@ -3,6 +3,7 @@
 from __future__ import annotations
 import os
 import struct
+import sys
 import hashlib
 from typing import Optional, Tuple, List
 
@@ -116,17 +117,30 @@ def list_images(dirpath: str) -> List[str]:
     Returns:
         List of full paths to image files.
     """
+    return _scan_files(dirpath, IMG_EXTS)
+
+
+def _scan_files(dirpath: str, exts) -> List[str]:
+    """Return sorted full paths of regular files in dirpath with an extension in exts.
+
+    Uses a single os.scandir pass: the file-type check comes from the
+    directory entry itself instead of a stat() per name. Paths are interned
+    because they key the per-frame thumb and view caches.
+    """
+    result = []
     try:
-        names = sorted(os.listdir(dirpath))
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() not in exts:
+                    continue
+                try:
+                    if entry.is_file():
+                        result.append(sys.intern(entry.path))
+                except OSError:
+                    continue
     except Exception:
         return []
-
-    result = []
-    for name in names:
-        path = os.path.join(dirpath, name)
-        ext = os.path.splitext(name)[1].lower()
-        if os.path.isfile(path) and ext in IMG_EXTS:
-            result.append(path)
+    result.sort()
     return result
 
 
@@ -166,18 +180,7 @@ def list_supported_files(dirpath: str) -> List[str]:
     from .viewers import get_registry
     exts = get_registry().supported_extensions()
 
-    try:
-        names = sorted(os.listdir(dirpath))
-    except Exception:
-        return []
-
-    result = []
-    for name in names:
-        path = os.path.join(dirpath, name)
-        ext = os.path.splitext(name)[1].lower()
-        if os.path.isfile(path) and ext in exts:
-            result.append(path)
-    return result
+    return _scan_files(dirpath, exts)
 
 
 def is_supported_file(filepath: str) -> bool:
@@ -4,16 +4,35 @@ from __future__ import annotations
 
 
 def clamp(v: float, a: float, b: float) -> float:
-    """Clamp value v to range [a, b]."""
+    """Clamp value v to range [a, b].
+
+    Kept as a conditional expression: in CPython it is several times faster
+    than ``max(a, min(b, v))``, which pays for two builtin calls.
+    """
     return a if v < a else b if v > b else v
 
 
 def lerp(a: float, b: float, t: float) -> float:
     """Linear interpolation from a to b by factor t (clamped to [0, 1])."""
-    t = clamp(t, 0.0, 1.0)
+    # clamp() inlined: lerp runs several times per gallery thumb per frame.
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
     return a + (b - a) * t
 
 
+def approach(current: float, target: float, max_step: float) -> float:
+    """Move current toward target by at most max_step, landing exactly on it."""
+    if current < target:
+        current += max_step
+        return target if current > target else current
+    if current > target:
+        current -= max_step
+        return target if current < target else current
+    return current
+
+
 def ease_out_quad(t: float) -> float:
     """Quadratic ease-out: decelerating to zero velocity."""
     if t <= 0.0:
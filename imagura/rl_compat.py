@@ -34,71 +34,120 @@ class _CTypesVec2(ctypes.Structure):
     ]
 
 
-def make_rect(x: float, y: float, w: float, h: float) -> Any:
-    """Create a raylib Rectangle compatible with the current binding."""
-    if hasattr(rl, 'Rectangle'):
+# Constructors are resolved once at import: the draw helpers call them many
+# times per frame, so they must not re-probe the binding on every call.
+
+def _resolve_rect_ctor():
+    ctor = getattr(rl, "Rectangle", None)
+    if ctor is not None:
         try:
-            return rl.Rectangle(x, y, w, h)
+            ctor(0.0, 0.0, 0.0, 0.0)
+            return ctor
         except Exception:
             pass
-    if hasattr(rl, 'ffi'):
-        r = rl.ffi.new("Rectangle *")
-        r[0].x = float(x)
-        r[0].y = float(y)
-        r[0].width = float(w)
-        r[0].height = float(h)
-        return r[0]
-    return _CTypesRect(float(x), float(y), float(w), float(h))
-
-
-def make_vec2(x: float, y: float) -> Any:
-    """Create a raylib Vector2 compatible with the current binding."""
-    if hasattr(rl, 'Vector2'):
+    ffi = getattr(rl, "ffi", None)
+    if ffi is not None:
+        def ffi_rect(x: float, y: float, w: float, h: float) -> Any:
+            return ffi.new("Rectangle *", [float(x), float(y), float(w), float(h)])[0]
+        return ffi_rect
+
+    def ctypes_rect(x: float, y: float, w: float, h: float) -> Any:
+        return _CTypesRect(float(x), float(y), float(w), float(h))
+    return ctypes_rect
+
+
+def _resolve_vec2_ctor():
+    ctor = getattr(rl, "Vector2", None)
+    if ctor is not None:
         try:
-            return rl.Vector2(x, y)
+            ctor(0.0, 0.0)
+            return ctor
         except Exception:
             pass
-    if hasattr(rl, 'ffi'):
-        v = rl.ffi.new("Vector2 *")
-        v[0].x = float(x)
-        v[0].y = float(y)
-        return v[0]
-    return _CTypesVec2(float(x), float(y))
+    ffi = getattr(rl, "ffi", None)
+    if ffi is not None:
+        def ffi_vec2(x: float, y: float) -> Any:
+            return ffi.new("Vector2 *", [float(x), float(y)])[0]
+        return ffi_vec2
 
+    def ctypes_vec2(x: float, y: float) -> Any:
+        return _CTypesVec2(float(x), float(y))
+    return ctypes_vec2
 
-def make_color(r: int, g: int, b: int, a: int) -> Any:
-    """Create a raylib Color compatible with the current binding."""
+
+def _resolve_color_ctor():
     ctor = getattr(rl, "Color", None)
-    if ctor:
+    if ctor is not None:
         try:
-            return ctor(int(r), int(g), int(b), int(a))
+            ctor(0, 0, 0, 0)
+            return ctor
         except Exception:
             pass
-    # Fallback: try ffi.new for CFFI bindings, then (r,g,b,a) tuple
     ffi = getattr(rl, "ffi", None)
-    if ffi:
+    if ffi is not None:
         try:
-            c = ffi.new("Color *", [int(r), int(g), int(b), int(a)])
-            return c[0]
+            ffi.new("Color *", [0, 0, 0, 0])
+
+            def ffi_color(r: int, g: int, b: int, a: int) -> Any:
+                return ffi.new("Color *", [r, g, b, a])[0]
+            return ffi_color
         except Exception:
             pass
-    return [int(r), int(g), int(b), int(a)]
+
+    def list_color(r: int, g: int, b: int, a: int) -> Any:
+        return [r, g, b, a]
+    return list_color
+
+
+# make_rect(x, y, w, h) / make_vec2(x, y): raylib structs for the current binding.
+make_rect = _resolve_rect_ctor()
+make_vec2 = _resolve_vec2_ctor()
+_new_color = _resolve_color_ctor()
+
+
+# Colors are passed to raylib by value and never mutated, so equal RGBA
+# tuples can share one struct. Keyed by the int-converted components.
+_COLOR_CACHE: dict = {}
+_COLOR_CACHE_LIMIT = 4096
+
+
+def make_color(r: int, g: int, b: int, a: int) -> Any:
+    """Create a raylib Color compatible with the current binding (memoized)."""
+    key = (int(r), int(g), int(b), int(a))
+    color = _COLOR_CACHE.get(key)
+    if color is None:
+        if len(_COLOR_CACHE) >= _COLOR_CACHE_LIMIT:
+            _COLOR_CACHE.clear()
+        color = _COLOR_CACHE[key] = _new_color(*key)
+    return color
+
+
+# Text functions cannot be probed before a window exists; the first TypeError
+# switches them to bytes for the rest of the run instead of retrying per call.
+_text_as_bytes = False
 
 
 def draw_text(text: str, x: int, y: int, size: int, color: Any) -> None:
     """Draw text with encoding fallback."""
-    try:
-        rl.DrawText(text, x, y, size, color)
-    except TypeError:
-        rl.DrawText(text.encode('utf-8'), x, y, size, color)
+    global _text_as_bytes
+    if not _text_as_bytes:
+        try:
+            rl.DrawText(text, x, y, size, color)
+            return
+        except TypeError:
+            _text_as_bytes = True
+    rl.DrawText(text.encode('utf-8'), x, y, size, color)
 
 
 def measure_text(text: str, size: int) -> int:
     """Measure text width with encoding fallback."""
-    try:
-        return rl.MeasureText(text, size)
-    except TypeError:
-        return rl.MeasureText(text.encode('utf-8'), size)
+    global _text_as_bytes
+    if not _text_as_bytes:
+        try:
+            return rl.MeasureText(text, size)
+        except TypeError:
+            _text_as_bytes = True
+    return rl.MeasureText(text.encode('utf-8'), size)
 
 
 def load_image(path: str) -> Any:
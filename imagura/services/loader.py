@@ -6,10 +6,11 @@ CPU data only; callbacks are marshalled back to the UI thread with poll_ui_event
 
 from __future__ import annotations
 
+import heapq
 from collections import deque
-from queue import Empty, PriorityQueue
-from threading import Lock, Thread
-from typing import Callable, Deque, List
+from itertools import count
+from threading import Condition, Thread
+from typing import Callable, Deque, List, Optional, Tuple
 
 from ..config import ASYNC_WORKERS, IDLE_THRESHOLD_SECONDS
 from ..logging import log, now
@@ -20,11 +21,17 @@ class AsyncContentLoader:
     """Priority-based background loader with UI-thread callback delivery."""
 
     def __init__(self, loader_func: Callable[[str], object], workers: int = ASYNC_WORKERS):
-        self.task_queue: PriorityQueue[LoadTask] = PriorityQueue()
+        # One heap behind one condition: workers sleep until a submit notifies
+        # them instead of waking on a poll timeout. ``seq`` keeps FIFO order
+        # within a priority without comparing LoadTasks.
+        self._heap: List[Tuple[int, int, LoadTask]] = []
+        self._cv = Condition()
+        self._seq = count()
         self.loader_func = loader_func
         self.running = True
+        # Workers append and the UI thread pops from the left; both are atomic
+        # deque operations, so the hand-off needs no lock.
         self.ui_events: Deque[UIEvent] = deque()
-        self.ui_lock = Lock()
         self.workers: List[Thread] = []
 
         for _ in range(max(1, int(workers))):
@@ -33,50 +40,79 @@ class AsyncContentLoader:
             self.workers.append(worker)
 
     def _worker_loop(self) -> None:
-        while self.running:
-            try:
-                task = self.task_queue.get(timeout=0.1)
-            except Empty:
-                continue
+        while True:
+            with self._cv:
+                while self.running and not self._heap:
+                    self._cv.wait()
+                if not self.running:
+                    return
+                task = heapq.heappop(self._heap)[2]
 
             result = None
             error = None
 
             try:
-                result = self.loader_func(task.path)
+                result = (task.load or self.loader_func)(task.path)
+                if task.prepare is not None:
+                    result = task.prepare(result)
             except Exception as exc:
                 error = exc
 
             self.push_ui_event(task.callback, (task.path, result, error))
-            self.task_queue.task_done()
 
     def push_ui_event(self, callback: Callable, args: tuple) -> None:
         """Queue a callback to run on the main/UI thread."""
-        with self.ui_lock:
-            self.ui_events.append(UIEvent(callback, args))
+        self.ui_events.append(UIEvent(callback, args))
 
     # Compatibility for the old imagura2.py call site while it is being migrated.
     _push_ui_event = push_ui_event
 
-    def poll_ui_events(self, max_events: int = 100) -> None:
-        events_to_process = []
-        with self.ui_lock:
-            count = 0
-            while self.ui_events and count < max_events:
-                events_to_process.append(self.ui_events.popleft())
-                count += 1
-
-        for event in events_to_process:
+    def poll_ui_events(self, max_events: int = 100, time_budget_s: Optional[float] = None) -> int:
+        """Run queued UI callbacks; returns how many were processed.
+
+        With ``time_budget_s``, stops once the budget is spent (after at least
+        one callback) and leaves the rest queued for the next frame, so a burst
+        of thumbnail uploads cannot stall a single frame.
+        """
+        popleft = self.ui_events.popleft
+        deadline = None if time_budget_s is None else now() + time_budget_s
+        processed = 0
+        while processed < max_events:
+            try:
+                event = popleft()
+            except IndexError:
+                break
+            processed += 1
             try:
                 event.callback(*event.args)
             except Exception as exc:
                 log(f"[UI_EVENT][ERR] {exc!r}")
-
-    def submit(self, path: str, priority: LoadPriority, callback: Callable) -> None:
-        self.task_queue.put(LoadTask(path, priority, callback, now()))
+            if deadline is not None and now() >= deadline:
+                break
+        return processed
+
+    def submit(
+        self,
+        path: str,
+        priority: LoadPriority,
+        callback: Callable,
+        prepare: Optional[Callable] = None,
+        load: Optional[Callable[[str], object]] = None,
+    ) -> None:
+        """Queue a load. ``prepare`` runs on the worker with the loaded data.
+
+        ``load`` replaces ``loader_func`` for this task, for jobs that are not
+        image decodes (e.g. EXIF reads).
+        """
+        task = LoadTask(path, priority, callback, now(), prepare, load)
+        with self._cv:
+            heapq.heappush(self._heap, (priority, next(self._seq), task))
+            self._cv.notify()
 
     def shutdown(self) -> None:
-        self.running = False
+        with self._cv:
+            self.running = False
+            self._cv.notify_all()
         for worker in self.workers:
             worker.join(timeout=1.0)
 
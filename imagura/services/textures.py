@@ -5,11 +5,15 @@ from __future__ import annotations
 import os
 from typing import Any, Optional
 
-from ..logging import log
+from ..logging import get_frame, log
 from ..rl_compat import rl
 from ..types import BitmapThumb, TextureInfo
 
 
+# Frames a deferred texture waits before UnloadTexture.
+DEFERRED_UNLOAD_FRAMES = 2
+
+
 class TextureManager:
     """Owns conversion to GPU textures and deferred unload bookkeeping.
 
@@ -40,12 +44,27 @@ class TextureManager:
             return
         tex_id = getattr(tex, "id", 0)
         if tex_id and tex_id > 0:
-            state.to_unload.append(tex)
+            state.to_unload.append((tex, get_frame()))
             log(f"[DEFER_UNLOAD] Queued: {os.path.basename(ti.path)} (id={tex_id})")
 
-    def process_deferred_unloads(self, state: Any) -> None:
-        while state.to_unload:
-            self.unload_texture(state.to_unload.pop())
+    def process_deferred_unloads(self, state: Any, min_age: int = DEFERRED_UNLOAD_FRAMES) -> None:
+        """Unload textures queued at least ``min_age`` frames ago.
+
+        The frame that dropped a texture may still have it in raylib's batch
+        or the driver's queue, so it is only freed a couple of frames later.
+        Pass ``min_age=0`` at shutdown to flush everything.
+        """
+        pending = state.to_unload
+        if not pending:
+            return
+        frame = get_frame()
+        kept = []
+        for tex, queued_frame in pending:
+            if frame - queued_frame >= min_age:
+                self.unload_texture(tex)
+            else:
+                kept.append((tex, queued_frame))
+        pending[:] = kept
 
     def unload_texture(self, tex: Any) -> None:
         try:
@@ -6,6 +6,7 @@ import os
 from typing import Any, Optional
 
 from .. import config as cfg
+from ..image_loading.content_loader import load_content_thumbnail_cpu
 from ..logging import log
 from ..types import BitmapThumb, LoadPriority
 
@@ -17,20 +18,35 @@ class ThumbnailService:
         self.texture_manager = texture_manager
 
     def schedule_around(self, state: Any, around_index: int) -> None:
-        n = len(state.current_dir_images)
+        images = state.current_dir_images
+        n = len(images)
         if n == 0:
             return
 
         span = int(cfg.THUMB_PRELOAD_SPAN)
         lo = max(0, around_index - span)
         hi = min(n - 1, around_index + span)
-        in_queue = set(state.thumb_queue)
+        thumb_queue = state.thumb_queue
+        thumb_cache = state.thumb_cache
+
+        # After a long jump, paths queued for the old position would be
+        # decoded before the ones now on screen; only the window stays queued.
+        if thumb_queue:
+            window = set(images[lo:hi + 1])
+            kept = [path for path in thumb_queue if path in window]
+            if len(kept) != len(thumb_queue):
+                thumb_queue.clear()
+                for path in kept:
+                    thumb_queue.append(path)
 
         for idx in range(lo, hi + 1):
-            path = state.current_dir_images[idx]
-            if path not in state.thumb_cache and path not in in_queue:
-                state.thumb_queue.append(path)
-                in_queue.add(path)
+            path = images[idx]
+            if path in thumb_cache:
+                # Keep LRU order meaningful: thumbs near the current image
+                # are the last ones enforce_cache_limit should evict.
+                thumb_cache.move_to_end(path)
+            elif path not in thumb_queue:
+                thumb_queue.append(path)
 
     def gallery_height(self, screen_h: int) -> int:
         return max(int(screen_h * cfg.GALLERY_HEIGHT_FRAC), int(cfg.GALLERY_MIN_HEIGHT_PX))
@@ -49,18 +65,45 @@ class ThumbnailService:
                 path,
                 LoadPriority.GALLERY,
                 self._make_loaded_callback(state, target_h),
+                prepare=self._make_prepare(target_h),
+                load=self._make_load(target_h),
             )
             budget -= 1
 
         self.enforce_cache_limit(state)
 
     def enforce_cache_limit(self, state: Any) -> None:
+        thumb_cache = state.thumb_cache
         limit = int(cfg.THUMB_CACHE_LIMIT)
-        while len(state.thumb_cache) > limit:
-            _, thumb = state.thumb_cache.popitem(last=False)
+        max_bytes = int(cfg.THUMB_CACHE_MAX_MB) * 1024 * 1024
+        # The cache must be LRU-ordered (OrderedDict at minimum: move_to_end and
+        # popitem(last=False) are used); only ThumbCache tracks bytes, so a
+        # bare OrderedDict gets the count cap alone.
+        while len(thumb_cache) > limit or (
+                len(thumb_cache) > 1 and getattr(thumb_cache, "nbytes", 0) > max_bytes):
+            _, thumb = thumb_cache.popitem(last=False)
             if thumb and thumb.texture:
                 self.texture_manager.unload_texture(thumb.texture)
 
+    def _make_load(self, target_h: int):
+        def load_thumb(path: str):
+            return load_content_thumbnail_cpu(path, target_h)
+
+        return load_thumb
+
+    def _make_prepare(self, target_h: int):
+        def prepare_thumb(loaded):
+            # Runs on the loader worker: the downscale happens off the UI
+            # thread, leaving only the texture upload for the callback.
+            viewer, cpu_data = loaded
+            try:
+                return viewer, viewer.prepare_thumbnail(cpu_data, target_h)
+            except Exception as exc:
+                log(f"[THUMB][PREP][ERR] {exc!r}")
+                return loaded
+
+        return prepare_thumb
+
     def _make_loaded_callback(self, state: Any, target_h: int):
         def on_thumb_loaded(path: str, loaded, error: Optional[Exception]) -> None:
             if error:
@@ -73,6 +73,7 @@ SETTINGS_TABS = [
             ("fld.close_btn_margin", "CLOSE_BTN_MARGIN", int, 10, 50),
             ("hdr.overlays", None, None, None, None),
             ("fld.show_scale_overlay", "SHOW_SCALE_OVERLAY", bool, None, None),
+            ("fld.text_shadow", "TEXT_SHADOW", bool, None, None),
             ("hdr.background", None, None, None, None),
             ("fld.blur", "BLUR_ENABLED", bool, None, None),
         ]
@@ -88,6 +89,7 @@ SETTINGS_TABS = [
             ("fld.gallery_min_alpha", "GALLERY_MIN_ALPHA", float, 0.1, 0.8),
             ("hdr.thumbnails", None, None, None, None),
             ("fld.thumb_cache_limit", "THUMB_CACHE_LIMIT", int, 50, 1000),
+            ("fld.thumb_cache_mb", "THUMB_CACHE_MAX_MB", int, 8, 1024),
             ("fld.thumb_padding", "THUMB_PADDING", int, 2, 20),
             ("fld.thumb_preload", "THUMB_PRELOAD_SPAN", int, 10, 100),
         ]
@@ -155,15 +157,26 @@ SETTINGS_ITEMS = []
 for tab in SETTINGS_TABS:
     SETTINGS_ITEMS.extend(tab["items"])
 
+# Editable rows of each tab (parallel to SETTINGS_TABS), so the editor can
+# address a field by its editable index instead of re-walking past headers.
+SETTINGS_EDITABLE_ITEMS = [
+    [item for item in tab["items"] if is_editable_item(item)] for tab in SETTINGS_TABS
+]
+
+_VISUAL_TO_EDITABLE = []
+_editable_count = 0
+for item in SETTINGS_ITEMS:
+    if is_editable_item(item):
+        _VISUAL_TO_EDITABLE.append(_editable_count)
+        _editable_count += 1
+    else:
+        _VISUAL_TO_EDITABLE.append(-1)
+
 
 def get_settings_item_index(item_idx: int) -> int:
     """Convert visual item index to editable item index (skip headers)."""
-    editable_idx = 0
-    for i, item in enumerate(SETTINGS_ITEMS):
-        if is_editable_item(item):  # Not a header / special row
-            if i == item_idx:
-                return editable_idx
-            editable_idx += 1
+    if 0 <= item_idx < len(_VISUAL_TO_EDITABLE):
+        return _VISUAL_TO_EDITABLE[item_idx]
     return -1
 
 
@@ -8,7 +8,7 @@ from typing import Deque, Tuple, Optional, Any
 from ..types import ViewParams, TextureInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationState:
     """State for all animations."""
     # Open animation
@@ -38,6 +38,11 @@ class AnimationState:
     toggle_zoom_to: ViewParams = field(default_factory=ViewParams)
     toggle_zoom_target_state: int = 0
 
+    # Per-frame step (seconds) for dt-driven fades, slides and playback.
+    # dt_clamp_frames > 0 caps it after idle frame skipping (see imagura2).
+    frame_dt: float = 0.0
+    dt_clamp_frames: int = 0
+
     @property
     def any_zoom_animating(self) -> bool:
         """Check if any zoom animation is running."""
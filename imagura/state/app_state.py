@@ -6,7 +6,7 @@ from typing import Optional, List, Deque, Tuple, Any
 from collections import OrderedDict, deque
 
 from .window import WindowState
-from .images import ImageListState
+from .images import ImageListState, ThumbCache, ThumbQueue
 from .view import ViewState
 from .gallery import GalleryState
 from .ui import UIState
@@ -17,7 +17,7 @@ from ..types import ViewParams, TextureInfo, ImageCache, BitmapThumb
 from ..config import BG_MODES, ANIM_SWITCH_KEYS_MS
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """
     Composite application state with backward-compatible property accessors.
@@ -115,19 +115,19 @@ class AppState:
         self.images.cache = value
 
     @property
-    def thumb_cache(self) -> "OrderedDict[str, BitmapThumb]":
+    def thumb_cache(self) -> ThumbCache:
         return self.images.thumb_cache
 
     @thumb_cache.setter
-    def thumb_cache(self, value: "OrderedDict[str, BitmapThumb]"):
+    def thumb_cache(self, value: ThumbCache):
         self.images.thumb_cache = value
 
     @property
-    def thumb_queue(self) -> Deque[str]:
+    def thumb_queue(self) -> ThumbQueue:
         return self.images.thumb_queue
 
     @thumb_queue.setter
-    def thumb_queue(self, value: Deque[str]):
+    def thumb_queue(self, value: ThumbQueue):
         self.images.thumb_queue = value
 
     @property
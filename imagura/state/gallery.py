@@ -7,7 +7,7 @@ from typing import Optional
 from ..config import DEFAULT_GALLERY_SORT_DESC, DEFAULT_GALLERY_SORT_KEY, GALLERY_HEIGHT_FRAC
 
 
-@dataclass
+@dataclass(slots=True)
 class GalleryState:
     """State for gallery/thumbnail strip."""
     center_index: float = 0.0
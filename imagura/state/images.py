@@ -8,15 +8,99 @@ from typing import List, Deque, Optional, Any
 from ..types import ImageCache, BitmapThumb, ViewParams
 
 
-@dataclass
+class ThumbQueue:
+    """FIFO of thumbnail paths with O(1) membership checks.
+
+    Paths are unique in the queue; appending a queued path is a no-op.
+    """
+
+    __slots__ = ("_items", "_members")
+
+    def __init__(self, paths=()):
+        self._items: Deque[str] = deque()
+        self._members: set = set()
+        for path in paths:
+            self.append(path)
+
+    def append(self, path: str) -> None:
+        if path not in self._members:
+            self._members.add(path)
+            self._items.append(path)
+
+    def popleft(self) -> str:
+        path = self._items.popleft()
+        self._members.discard(path)
+        return path
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._members.clear()
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._members
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+class ThumbCache(OrderedDict):
+    """LRU map of path -> BitmapThumb that tracks the GPU bytes it holds.
+
+    ``nbytes`` counts RGBA texture bytes of loaded thumbs; placeholders for
+    in-flight loads count as zero.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.nbytes = 0
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def _thumb_bytes(thumb: Optional[BitmapThumb]) -> int:
+        if thumb is None or not thumb.texture:
+            return 0
+        w, h = thumb.size
+        return w * h * 4
+
+    def __setitem__(self, path: str, thumb: BitmapThumb) -> None:
+        old = OrderedDict.get(self, path)
+        if old is not None:
+            self.nbytes -= self._thumb_bytes(old)
+        super().__setitem__(path, thumb)
+        self.nbytes += self._thumb_bytes(thumb)
+
+    def __delitem__(self, path: str) -> None:
+        self.nbytes -= self._thumb_bytes(OrderedDict.get(self, path))
+        super().__delitem__(path)
+
+    def pop(self, path, *default):
+        if path in self:
+            thumb = super().pop(path)
+            self.nbytes -= self._thumb_bytes(thumb)
+            return thumb
+        return super().pop(path, *default)
+
+    def popitem(self, last: bool = True):
+        path, thumb = super().popitem(last=last)
+        self.nbytes -= self._thumb_bytes(thumb)
+        return path, thumb
+
+    def clear(self) -> None:
+        super().clear()
+        self.nbytes = 0
+
+
+@dataclass(slots=True)
 class ImageListState:
     """State for image list and caching."""
     images: List[str] = field(default_factory=list)
     index: int = 0
     cache: ImageCache = field(default_factory=ImageCache)
-    thumb_cache: "OrderedDict[str, BitmapThumb]" = field(default_factory=OrderedDict)
-    thumb_queue: Deque[str] = field(default_factory=deque)
-    to_unload: List[Any] = field(default_factory=list)  # List[rl.Texture2D]
+    thumb_cache: ThumbCache = field(default_factory=ThumbCache)
+    thumb_queue: ThumbQueue = field(default_factory=ThumbQueue)
+    to_unload: List[Any] = field(default_factory=list)  # List[(rl.Texture2D, frame queued)]
     view_memory: dict = field(default_factory=dict)
     user_zoom_memory: dict = field(default_factory=dict)
     playback: Any = None  # Optional[Playback] — active animated content playback
@@ -1,21 +1,42 @@
 """Input state - mouse, panning, clicks."""
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import FrozenSet, Optional, Tuple
 
-from ..config import DOUBLE_CLICK_TIME_MS
+from .. import config as cfg
 from ..logging import now
 
 
-@dataclass
+@dataclass(slots=True)
 class InputState:
     """State for input handling."""
+    # Sampled once per frame by the main loop (poll_frame_input)
+    mouse_x: float = 0.0
+    mouse_y: float = 0.0
+    left_pressed: bool = False
+    wheel: float = 0.0
+    keys_pressed: FrozenSet[int] = field(default_factory=frozenset)
+    zoom_in_held: bool = False
+    zoom_out_held: bool = False
+    next_held: bool = False
+    prev_held: bool = False
+    any_input: bool = False  # Mouse moved, wheel, button or key press this frame
     is_panning: bool = False
     pan_start_mouse: Tuple[float, float] = (0.0, 0.0)
     pan_start_offset: Tuple[float, float] = (0.0, 0.0)
     last_click_time: float = 0.0
-    last_click_pos: Tuple[int, int] = (0, 0)
+    # Kept as two ints so recording a click doesn't allocate a tuple
+    last_click_x: int = 0
+    last_click_y: int = 0
+
+    @property
+    def last_click_pos(self) -> Tuple[int, int]:
+        return (self.last_click_x, self.last_click_y)
+
+    @last_click_pos.setter
+    def last_click_pos(self, value: Tuple[int, int]) -> None:
+        self.last_click_x, self.last_click_y = value
 
     def start_pan(self, mouse_x: float, mouse_y: float,
                   offset_x: float, offset_y: float) -> None:
@@ -41,19 +62,22 @@ class InputState:
         dx, dy = self.get_pan_delta(mouse_x, mouse_y)
         return (self.pan_start_offset[0] + dx, self.pan_start_offset[1] + dy)
 
-    def check_double_click(self, x: int, y: int, max_distance: int = 10) -> bool:
-        """Check if this click is a double-click. Updates state."""
-        t = now()
-        is_double = False
+    def check_double_click(self, x: int, y: int, max_distance: int = 10,
+                           t: Optional[float] = None) -> bool:
+        """Check if this click is a double-click. Updates state.
+
+        ``t`` defaults to now(); the window follows the live
+        DOUBLE_CLICK_TIME_MS setting.
+        """
+        if t is None:
+            t = now()
 
-        if (t - self.last_click_time) < (DOUBLE_CLICK_TIME_MS / 1000.0):
-            dx = abs(x - self.last_click_pos[0])
-            dy = abs(y - self.last_click_pos[1])
-            if dx < max_distance and dy < max_distance:
-                is_double = True
+        if (t - self.last_click_time) < (cfg.DOUBLE_CLICK_TIME_MS / 1000.0):
+            if abs(x - self.last_click_x) < max_distance and abs(y - self.last_click_y) < max_distance:
                 self.last_click_time = 0.0  # Reset to prevent triple-click
                 return True
 
         self.last_click_time = t
-        self.last_click_pos = (x, y)
+        self.last_click_x = x
+        self.last_click_y = y
         return False
@@ -8,7 +8,7 @@ from ..types import ViewParams, TextureInfo
 from ..config import ANIM_SWITCH_KEYS_MS
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadingState:
     """State for async loading coordination."""
     async_loader: Optional[Any] = None  # AsyncImageLoader
@@ -88,6 +88,9 @@ class ToolbarState:
     target_alpha: float = 0.0  # Target visibility
     buttons: List[ToolbarButton] = field(default_factory=lambda: list(DEFAULT_TOOLBAR_BUTTONS))
     hover_index: int = -1  # -1 = no hover
+    # Cached (panel_x, panel_width, button centre xs); rebuilt when layout_key changes
+    layout_key: Optional[Tuple[int, int]] = None
+    layout: Optional[Tuple[int, int, Tuple[int, ...]]] = None
 
     def get_hovered_button(self) -> Optional[ToolbarButton]:
         """Get currently hovered button or None."""
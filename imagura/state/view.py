@@ -7,7 +7,7 @@ from typing import Tuple
 from ..types import ViewParams
 
 
-@dataclass
+@dataclass(slots=True)
 class ViewState:
     """State for view/zoom parameters."""
     view: ViewParams = field(default_factory=ViewParams)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional, Any, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowState:
     """Window-related state."""
     screen_w: int = 0
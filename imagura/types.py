@@ -10,16 +10,19 @@ class LoadPriority(IntEnum):
     """Priority levels for async image loading."""
     CURRENT = 0   # Currently viewed image - highest priority
     NEIGHBOR = 1  # Previous/next images for smooth navigation
-    GALLERY = 2   # Thumbnail images - lowest priority
+    GALLERY = 2   # Thumbnail images
+    METADATA = 3  # EXIF reads for the HUD - lowest priority
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadTask:
     """A task for the async image loader."""
     path: str
     priority: LoadPriority
     callback: Callable
     timestamp: float = 0.0
+    prepare: Optional[Callable] = None  # Worker-side post-processing of the loaded data
+    load: Optional[Callable] = None  # Replaces the loader's default load function for this task
 
     def __lt__(self, other: LoadTask) -> bool:
         """Compare tasks for priority queue ordering."""
@@ -28,14 +31,14 @@ class LoadTask:
         return self.timestamp < other.timestamp
 
 
-@dataclass
+@dataclass(slots=True)
 class UIEvent:
     """An event to be processed on the main/UI thread."""
     callback: Callable
     args: tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ViewParams:
     """View transformation parameters (scale and offset)."""
     scale: float = 1.0
@@ -47,7 +50,7 @@ class ViewParams:
         return ViewParams(self.scale, self.offx, self.offy)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextureInfo:
     """Information about a loaded texture."""
     tex: Any  # rl.Texture2D - using Any to avoid raylib import
@@ -60,7 +63,7 @@ class TextureInfo:
         return TextureInfo(tex=self.tex, w=self.w, h=self.h, path=self.path)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageCache:
     """Cache for prev/curr/next images."""
     prev: Optional[TextureInfo] = None
@@ -68,7 +71,7 @@ class ImageCache:
     next: Optional[TextureInfo] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BitmapThumb:
     """A thumbnail bitmap for the gallery."""
     texture: Optional[Any] = None  # rl.Texture2D
@@ -65,12 +65,12 @@ def get_context_menu_item_at(state: "AppState", mx: float, my: float) -> int:
     if not (x <= mx <= x + menu_w):
         return -1
 
-    item_start_y = y + MENU_PADDING
-    for i in range(n_items):
-        item_y = item_start_y + i * MENU_ITEM_HEIGHT
-        if item_y <= my < item_y + MENU_ITEM_HEIGHT:
-            return i
-    return -1
+    # Items are a uniform vertical strip: index directly instead of scanning.
+    offset = my - (y + MENU_PADDING)
+    if offset < 0:
+        return -1
+    i = int(offset // MENU_ITEM_HEIGHT)
+    return i if i < n_items else -1
 
 
 def draw_context_menu(state: "AppState") -> None:
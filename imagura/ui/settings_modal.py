@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 from .. import config as cfg
@@ -30,16 +31,16 @@ from ..config import (
 )
 from ..i18n import LANGUAGES, get_language, persist_language, tr
 from ..logging import log, now
-from ..rl_compat import draw_text as RL_DrawText
 from ..rl_compat import make_color as RL_Color
-from ..rl_compat import make_vec2 as RL_V2
 from ..rl_compat import rl
 from ..settings_persistence import (
+    SETTINGS_EDITABLE_ITEMS,
     SETTINGS_TABS,
     is_editable_item,
     save_config_value_impl,
     validate_settings_value,
 )
+from .text_overlays import draw_text_raw, measure_text_width
 
 if TYPE_CHECKING:
     from ..state import AppState
@@ -51,8 +52,6 @@ def _save_config_value(config_key: str, value, val_type: type, state: "AppState"
     Falls back to the pure persistence impl if imagura2 has not been imported
     (e.g. when the UI module is exercised in isolation).
     """
-    import sys
-
     shim = getattr(sys.modules.get("imagura2"), "save_config_value", None)
     if shim is not None:
         return shim(config_key, value, val_type, state)
@@ -92,10 +91,7 @@ def _modal_rect(state: "AppState"):
 
 def _text_w(state: "AppState", text: str, size: int) -> int:
     if state.unicode_font:
-        try:
-            return int(rl.MeasureTextEx(state.unicode_font, text.encode("utf-8"), size, 1.0).x)
-        except Exception:
-            pass
+        return measure_text_width(state, text, size)
     return len(text) * (size // 2)
 
 
@@ -315,9 +311,8 @@ def handle_settings_input(state: "AppState") -> bool:
         return True
 
     tab_items = current_tab["items"]
-
-    # Count editable items in current tab
-    total_editable = sum(1 for item in tab_items if is_editable_item(item))
+    editable_items = SETTINGS_EDITABLE_ITEMS[settings.active_tab]
+    total_editable = len(editable_items)
 
     shift_held = rl.IsKeyDown(rl.KEY_LEFT_SHIFT) or rl.IsKeyDown(rl.KEY_RIGHT_SHIFT)
     ctrl_held = rl.IsKeyDown(rl.KEY_LEFT_CONTROL) or rl.IsKeyDown(rl.KEY_RIGHT_CONTROL)
@@ -346,14 +341,8 @@ def handle_settings_input(state: "AppState") -> bool:
                 if _save_current_edit_for_tab(state, settings.active_tab):
                     settings.editing_item = -1
                     edit.reset()
-                    _editable = 0
-                    for _item in tab_items:
-                        if is_editable_item(_item):
-                            if _editable == clicked_field:
-                                _cur = getattr(cfg, _item[1], False)
-                                _save_config_value(_item[1], not _cur, bool, state)
-                                break
-                            _editable += 1
+                    config_key = editable_items[clicked_field][1]
+                    _save_config_value(config_key, not getattr(cfg, config_key, False), bool, state)
                 return True
             elif clicked_field == settings.editing_item:
                 edit.clear_selection()
@@ -393,11 +382,14 @@ def handle_settings_input(state: "AppState") -> bool:
             return True
 
         # Text input
+        typed = []
         key = rl.GetCharPressed()
         while key > 0:
             if (48 <= key <= 57) or key == 46 or key == 45:
-                edit.insert_text(chr(key))
+                typed.append(chr(key))
             key = rl.GetCharPressed()
+        if typed:
+            edit.insert_text("".join(typed))
 
         if rl.IsKeyPressed(rl.KEY_BACKSPACE):
             edit.delete_char_before()
@@ -464,48 +456,31 @@ def _save_current_edit_for_tab(state: "AppState", tab_idx: int) -> bool:
     if settings.editing_item < 0:
         return True
 
-    tab = SETTINGS_TABS[tab_idx]
-    if tab.get("type") == "info":
+    editable_items = SETTINGS_EDITABLE_ITEMS[tab_idx]
+    if settings.editing_item >= len(editable_items):
         return True
-    tab_items = tab["items"]
-    editable_idx = 0
-
-    for item in tab_items:
-        if is_editable_item(item):
-            if editable_idx == settings.editing_item:
-                label, config_key, val_type, min_val, max_val = item
-                is_valid, parsed_val, error = validate_settings_value(
-                    settings.edit_state.text, val_type, min_val, max_val
-                )
-                if is_valid:
-                    _save_config_value(config_key, parsed_val, val_type, state)
-                    log(f"[SETTINGS] Updated {config_key} = {parsed_val}")
-                    return True
-                else:
-                    log(f"[SETTINGS] Validation failed: {error}")
-                    return False
-            editable_idx += 1
-    return True
+
+    label, config_key, val_type, min_val, max_val = editable_items[settings.editing_item]
+    is_valid, parsed_val, error = validate_settings_value(
+        settings.edit_state.text, val_type, min_val, max_val
+    )
+    if is_valid:
+        _save_config_value(config_key, parsed_val, val_type, state)
+        log(f"[SETTINGS] Updated {config_key} = {parsed_val}")
+        return True
+    log(f"[SETTINGS] Validation failed: {error}")
+    return False
 
 
 def _start_editing_field(state: "AppState", tab_idx: int, field_idx: int) -> None:
     """Start editing a specific field."""
-    settings = state.ui.settings
-    tab = SETTINGS_TABS[tab_idx]
-    if tab.get("type") == "info":
+    editable_items = SETTINGS_EDITABLE_ITEMS[tab_idx]
+    if not 0 <= field_idx < len(editable_items):
         return
-    tab_items = tab["items"]
-    editable_idx = 0
-
-    for item in tab_items:
-        if is_editable_item(item):
-            if editable_idx == field_idx:
-                config_key = item[1]
-                current_val = getattr(cfg, config_key, 0)
-                settings.editing_item = field_idx
-                settings.edit_state.set_text(str(current_val))
-                return
-            editable_idx += 1
+    settings = state.ui.settings
+    current_val = getattr(cfg, editable_items[field_idx][1], 0)
+    settings.editing_item = field_idx
+    settings.edit_state.set_text(str(current_val))
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -791,12 +766,4 @@ def draw_settings_window(state: "AppState"):
 
 def _draw_settings_text(state: "AppState", text: str, x: int, y: int, size: int, color: tuple):
     """Helper to draw text with unicode support."""
-    color_rl = RL_Color(*color)
-    if state.unicode_font:
-        try:
-            rl.DrawTextEx(state.unicode_font, text.encode('utf-8'),
-                          RL_V2(x, y), size, 1.0, color_rl)
-            return
-        except Exception:
-            pass
-    RL_DrawText(text, x, y, size, color_rl)
+    draw_text_raw(state, text, x, y, size, RL_Color(*color))
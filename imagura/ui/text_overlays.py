@@ -6,7 +6,7 @@ import os
 from typing import TYPE_CHECKING
 
 from .. import config as cfg
-from ..image_metadata import get_image_metadata
+from ..image_metadata import get_image_metadata, peek_image_metadata, request_image_metadata
 from ..rl_compat import draw_text as RL_DrawText
 from ..rl_compat import make_color as RL_Color
 from ..rl_compat import make_vec2 as RL_V2
@@ -17,22 +17,71 @@ if TYPE_CHECKING:
     from ..state import AppState
 
 
-def draw_text_raw(state: "AppState", text: str, x: int, y: int, font_size: int, color) -> None:
-    """Draw text using the app Unicode font when available."""
-    if state.unicode_font:
+# DrawTextEx copies the position, so one scratch Vector2 serves every call
+# (the shadow passes draw the same text ~100 times).
+_TEXT_POS = RL_V2(0, 0)
+
+
+def _draw_text_encoded(state: "AppState", text: str, encoded, x: int, y: int, font_size: int, color) -> None:
+    if encoded is not None:
+        pos = _TEXT_POS
+        pos.x = x
+        pos.y = y
         try:
-            rl.DrawTextEx(state.unicode_font, text.encode("utf-8"), RL_V2(x, y), font_size, 1.0, color)
+            rl.DrawTextEx(state.unicode_font, encoded, pos, font_size, 1.0, color)
             return
         except Exception:
             pass
     RL_DrawText(text, x, y, font_size, color)
 
 
+# Menu and settings labels are redrawn unchanged every frame; keep their UTF-8
+# bytes so DrawTextEx does not re-encode them. Keyed by the (translated) text,
+# so a language switch simply produces new entries.
+_ENCODE_CACHE: dict = {}
+_ENCODE_CACHE_LIMIT = 512
+
+
+def _encode_for_font(state: "AppState", text: str):
+    if not state.unicode_font:
+        return None
+    encoded = _ENCODE_CACHE.get(text)
+    if encoded is None:
+        encoded = text.encode("utf-8")
+        if len(_ENCODE_CACHE) >= _ENCODE_CACHE_LIMIT:
+            _ENCODE_CACHE.clear()
+        _ENCODE_CACHE[text] = encoded
+    return encoded
+
+
+def draw_text_raw(state: "AppState", text: str, x: int, y: int, font_size: int, color) -> None:
+    """Draw text using the app Unicode font when available."""
+    _draw_text_encoded(state, text, _encode_for_font(state, text), x, y, font_size, color)
+
+
+# Overlay strings repeat every frame (filename, zoom %, menu labels), so widths
+# are memoized per (text, size, font present); cleared wholesale when full.
+_MEASURE_CACHE: dict = {}
+_MEASURE_CACHE_LIMIT = 512
+
+
 def measure_text_width(state: "AppState", text: str, font_size: int) -> int:
     """Measure text width using the active app font."""
-    if state.unicode_font:
+    font = state.unicode_font
+    key = (text, font_size, font is not None)
+    width = _MEASURE_CACHE.get(key)
+    if width is None:
+        width = _measure_text_width(font, text, font_size)
+        if len(_MEASURE_CACHE) >= _MEASURE_CACHE_LIMIT:
+            _MEASURE_CACHE.clear()
+        _MEASURE_CACHE[key] = width
+    return width
+
+
+def _measure_text_width(font, text: str, font_size: int) -> int:
+    if font:
         try:
-            return int(rl.MeasureTextEx(state.unicode_font, text.encode("utf-8"), font_size, 1.0).x)
+            return int(rl.MeasureTextEx(font, text.encode("utf-8"), font_size, 1.0).x)
         except Exception:
             pass
     try:
@@ -61,9 +110,10 @@ _SHADOW_PASSES = _build_shadow_passes()
 
 def draw_text_shadowed(state: "AppState", text: str, x: int, y: int, font_size: int, color) -> None:
     """Draw text with a soft drop shadow."""
-    for dx, dy, alpha in _SHADOW_PASSES:
-        draw_text_raw(state, text, x + dx, y + dy, font_size, RL_Color(0, 0, 0, alpha))
-    draw_text_raw(state, text, x, y, font_size, color)
+    encoded = _encode_for_font(state, text)
+    for dx, dy, alpha in (_SHADOW_PASSES if cfg.TEXT_SHADOW else ()):
+        _draw_text_encoded(state, text, encoded, x + dx, y + dy, font_size, RL_Color(0, 0, 0, alpha))
+    _draw_text_encoded(state, text, encoded, x, y, font_size, color)
 
 
 def draw_filename_overlay(state: "AppState") -> None:
@@ -92,33 +142,57 @@ def draw_scale_overlay(state: "AppState") -> None:
     x = (state.screenW - text_width) // 2
     y = state.screenH - 60
 
-    for dx, dy, sa in _SHADOW_PASSES:
+    encoded = _encode_for_font(state, text)
+    for dx, dy, sa in (_SHADOW_PASSES if cfg.TEXT_SHADOW else ()):
         shadow_a = int(sa * alpha)
         if shadow_a > 0:
-            draw_text_raw(state, text, x + dx, y + dy, font_size, RL_Color(0, 0, 0, shadow_a))
+            _draw_text_encoded(state, text, encoded, x + dx, y + dy, font_size, RL_Color(0, 0, 0, shadow_a))
 
-    draw_text_raw(state, text, x, y, font_size, RL_Color(255, 255, 255, int(255 * alpha)))
+    _draw_text_encoded(state, text, encoded, x, y, font_size, RL_Color(255, 255, 255, int(255 * alpha)))
 
 
-def draw_hud(state: "AppState") -> None:
-    """Draw the optional diagnostic HUD."""
-    if not state.show_hud:
-        return
+# The HUD text only changes with the image, zoom percentage or language, so the
+# lines (including the EXIF lookup) are rebuilt only when that key changes.
+_HUD_CACHE: dict = {"key": None, "lines": []}
 
-    hud_font_size = cfg.FONT_DISPLAY_SIZE
-    line_spacing = hud_font_size + 4
-    hud_color = RL_Color(255, 255, 255, 230)
 
-    hud_lines = []
-    total = len(state.current_dir_images)
-    hud_lines.append(f"[{state.index + 1}/{total}]")
-    hud_lines.append(f"{int(round(state.view.scale * 100))}% ({zoom_mode_label(state.zoom_state_cycle)})")
+def _on_hud_metadata_ready(path: str) -> None:
+    # The EXIF lines arrived after the HUD was built without them.
+    _HUD_CACHE["key"] = None
+
+
+def _hud_metadata(state: "AppState", path: str):
+    """EXIF metadata for the HUD; read on a worker when the loader is running."""
+    if state.async_loader is None:
+        return get_image_metadata(path)
+    metadata = peek_image_metadata(path)
+    if metadata is None:
+        request_image_metadata(path, state.async_loader, _on_hud_metadata_ready)
+    return metadata
 
-    if state.cache.curr:
-        hud_lines.append(f"{state.cache.curr.w} x {state.cache.curr.h}")
 
-    if state.index < len(state.current_dir_images):
-        metadata = get_image_metadata(state.current_dir_images[state.index])
+def _hud_lines(state: "AppState") -> list:
+    images = state.current_dir_images
+    total = len(images)
+    curr = state.cache.curr
+    path = images[state.index] if state.index < total else None
+    key = (
+        state.index, total, path, int(round(state.view.scale * 100)), state.zoom_state_cycle,
+        (curr.w, curr.h) if curr else None, cfg.LANGUAGE,
+    )
+    if key == _HUD_CACHE["key"]:
+        return _HUD_CACHE["lines"]
+
+    hud_lines = [
+        f"[{state.index + 1}/{total}]",
+        f"{key[3]}% ({zoom_mode_label(state.zoom_state_cycle)})",
+    ]
+
+    if curr:
+        hud_lines.append(f"{curr.w} x {curr.h}")
+
+    if path is not None:
+        metadata = _hud_metadata(state, path)
         if metadata:
             if "date" in metadata:
                 hud_lines.append(metadata["date"])
@@ -139,6 +213,21 @@ def draw_hud(state: "AppState") -> None:
             if exp_info:
                 hud_lines.append(" | ".join(exp_info))
 
+    _HUD_CACHE["key"] = key
+    _HUD_CACHE["lines"] = hud_lines
+    return hud_lines
+
+
+def draw_hud(state: "AppState") -> None:
+    """Draw the optional diagnostic HUD."""
+    if not state.show_hud:
+        return
+
+    hud_font_size = cfg.FONT_DISPLAY_SIZE
+    line_spacing = hud_font_size + 4
+    hud_color = RL_Color(255, 255, 255, 230)
+
+    hud_lines = _hud_lines(state)
     hud_y = state.screenH - (len(hud_lines) * line_spacing + 20)
     for i, line in enumerate(hud_lines):
         draw_text_shadowed(state, line, 12, hud_y + i * line_spacing, hud_font_size, hud_color)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from bisect import bisect_left
 from typing import TYPE_CHECKING, Optional
 
 from ..config import (
@@ -14,6 +15,7 @@ from ..config import (
     TOOLBAR_TRIGGER_FRAC,
     TOOLBAR_TRIGGER_MIN_PX,
 )
+from ..math_utils import approach
 from ..rl_compat import make_color as RL_Color
 from ..rl_compat import make_vec2 as RL_V2
 from ..rl_compat import rl
@@ -22,17 +24,14 @@ from ..state.ui import ToolbarButton, ToolbarButtonId
 if TYPE_CHECKING:
     from ..state import AppState
 
+_TOOLBAR_ALPHA_SPEED = 1000.0 / TOOLBAR_SLIDE_MS
+
 
 def update_toolbar_alpha(state: "AppState") -> None:
     """Animate toolbar visibility toward its target alpha."""
     toolbar = state.ui.toolbar
     if abs(toolbar.alpha - toolbar.target_alpha) > 0.01:
-        speed = 1000.0 / TOOLBAR_SLIDE_MS
-        dt = rl.GetFrameTime()
-        if toolbar.target_alpha > toolbar.alpha:
-            toolbar.alpha = min(toolbar.target_alpha, toolbar.alpha + speed * dt)
-        else:
-            toolbar.alpha = max(toolbar.target_alpha, toolbar.alpha - speed * dt)
+        toolbar.alpha = approach(toolbar.alpha, toolbar.target_alpha, _TOOLBAR_ALPHA_SPEED * state.anim.frame_dt)
     else:
         toolbar.alpha = toolbar.target_alpha
 
@@ -60,13 +59,39 @@ def update_toolbar_input(state: "AppState", mouse, blocked: bool) -> Optional[To
     return toolbar.buttons[toolbar.hover_index]
 
 
-def get_toolbar_panel_bounds(state: "AppState") -> tuple[int, int]:
-    """Return toolbar panel `(x, width)`."""
+def _toolbar_layout(state: "AppState") -> tuple[int, int, tuple[int, ...]]:
+    """Return `(panel_x, panel_width, button_centre_xs)`, cached per screen width.
+
+    Hit-testing runs on every mouse move and drawing every frame; the layout
+    only changes with the window width (buttons are fixed at startup).
+    """
+    toolbar = state.ui.toolbar
+    key = (state.screenW, len(toolbar.buttons))
+    if toolbar.layout_key == key:
+        return toolbar.layout
+
     sw = state.screenW
     buttons_width = _buttons_width(state)
     min_panel_width = buttons_width + TOOLBAR_BTN_RADIUS * 2 * 2
     panel_width = max(min_panel_width, int(sw * 0.6))
     panel_x = (sw - panel_width) // 2
+
+    centres = []
+    current_x = (sw - buttons_width) // 2 + TOOLBAR_BTN_RADIUS
+    for btn in toolbar.buttons:
+        centres.append(current_x)
+        current_x += TOOLBAR_BTN_RADIUS * 2 + TOOLBAR_BTN_SPACING
+        if btn.separator_after:
+            current_x += TOOLBAR_BTN_SPACING
+
+    toolbar.layout = (panel_x, panel_width, tuple(centres))
+    toolbar.layout_key = key
+    return toolbar.layout
+
+
+def get_toolbar_panel_bounds(state: "AppState") -> tuple[int, int]:
+    """Return toolbar panel `(x, width)`."""
+    panel_x, panel_width, _ = _toolbar_layout(state)
     return panel_x, panel_width
 
 
@@ -85,20 +110,18 @@ def get_toolbar_button_at(state: "AppState", mx: float, my: float) -> int:
     if toolbar.alpha < 0.5:
         return -1
 
-    separator_width = TOOLBAR_BTN_SPACING
-    start_x = (state.screenW - _buttons_width(state)) // 2 + TOOLBAR_BTN_RADIUS
-    cy = TOOLBAR_HEIGHT // 2
-
-    current_x = start_x
-    for i, btn in enumerate(toolbar.buttons):
-        dx = mx - current_x
-        dy = my - cy
-        if (dx * dx + dy * dy) <= (TOOLBAR_BTN_RADIUS * TOOLBAR_BTN_RADIUS):
-            return i
-
-        current_x += TOOLBAR_BTN_RADIUS * 2 + TOOLBAR_BTN_SPACING
-        if btn.separator_after:
-            current_x += separator_width
+    dy = my - TOOLBAR_HEIGHT // 2
+    r_sq = TOOLBAR_BTN_RADIUS * TOOLBAR_BTN_RADIUS - dy * dy
+    if r_sq < 0:
+        return -1
+    # Centres are sorted; only the buttons either side of mx can contain it.
+    centres = _toolbar_layout(state)[2]
+    i = bisect_left(centres, mx)
+    for candidate in (i - 1, i):
+        if 0 <= candidate < len(centres):
+            dx = mx - centres[candidate]
+            if dx * dx <= r_sq:
+                return candidate
 
     return -1
 
@@ -109,68 +132,39 @@ def draw_toolbar(state: "AppState") -> None:
     if toolbar.alpha < 0.01:
         return
 
-    sw = state.screenW
     alpha = toolbar.alpha
     n_buttons = len(toolbar.buttons)
     separator_width = TOOLBAR_BTN_SPACING
-    buttons_width = _buttons_width(state)
-    min_panel_width = buttons_width + TOOLBAR_BTN_RADIUS * 2 * 2
-    panel_width = max(min_panel_width, int(sw * 0.6))
-    panel_x = (sw - panel_width) // 2
+    panel_x, panel_width, centres = _toolbar_layout(state)
     fade_width = 40
     bg_alpha_max = int(255 * TOOLBAR_BG_ALPHA * alpha)
 
-    step = 4
-    for i in range(0, fade_width, step):
-        fade_alpha = int(bg_alpha_max * (i / fade_width))
-        rl.DrawRectangle(panel_x + i, 0, step, TOOLBAR_HEIGHT, RL_Color(0, 0, 0, fade_alpha))
-
-    rl.DrawRectangle(
-        panel_x + fade_width,
-        0,
-        panel_width - fade_width * 2,
-        TOOLBAR_HEIGHT,
-        RL_Color(0, 0, 0, bg_alpha_max),
-    )
-
-    for i in range(0, fade_width, step):
-        fade_alpha = int(bg_alpha_max * (1.0 - i / fade_width))
-        rl.DrawRectangle(
-            panel_x + panel_width - fade_width + i,
-            0,
-            step,
-            TOOLBAR_HEIGHT,
-            RL_Color(0, 0, 0, fade_alpha),
-        )
+    clear = RL_Color(0, 0, 0, 0)
+    solid = RL_Color(0, 0, 0, bg_alpha_max)
+    # Edge fades as vertex-colour gradients: one quad per side instead of a
+    # strip of stepped rectangles.
+    rl.DrawRectangleGradientH(panel_x, 0, fade_width, TOOLBAR_HEIGHT, clear, solid)
+    rl.DrawRectangle(panel_x + fade_width, 0, panel_width - fade_width * 2, TOOLBAR_HEIGHT, solid)
+    rl.DrawRectangleGradientH(panel_x + panel_width - fade_width, 0, fade_width, TOOLBAR_HEIGHT, solid, clear)
 
-    current_x = (sw - buttons_width) // 2 + TOOLBAR_BTN_RADIUS
     cy = TOOLBAR_HEIGHT // 2
+    icon_r = TOOLBAR_BTN_RADIUS * 0.45
+    # Every button fades with the toolbar, so only the hover background differs.
+    icon_color = RL_Color(255, 255, 255, int(255 * alpha))
+    bg_idle = RL_Color(0, 0, 0, int(80 * alpha))
+    bg_hover = RL_Color(0, 0, 0, int(128 * alpha))
 
     for i, btn in enumerate(toolbar.buttons):
-        cx = current_x
-        is_hover = i == toolbar.hover_index
-
-        btn_alpha = int(255 * alpha)
-        bg_btn_alpha = int(128 * alpha) if is_hover else int(80 * alpha)
-        rl.DrawCircle(cx, cy, TOOLBAR_BTN_RADIUS, RL_Color(0, 0, 0, bg_btn_alpha))
-        rl.DrawCircleLines(cx, cy, TOOLBAR_BTN_RADIUS, RL_Color(255, 255, 255, btn_alpha))
-
-        icon_r = TOOLBAR_BTN_RADIUS * 0.45
-        icon_color = RL_Color(255, 255, 255, btn_alpha)
-        if btn.id == ToolbarButtonId.SETTINGS:
-            draw_gear_icon(cx, cy, icon_r, icon_color)
-        elif btn.id == ToolbarButtonId.ROTATE_CW:
-            draw_rotate_icon(cx, cy, icon_r, clockwise=True, color=icon_color)
-        elif btn.id == ToolbarButtonId.ROTATE_CCW:
-            draw_rotate_icon(cx, cy, icon_r, clockwise=False, color=icon_color)
-        elif btn.id == ToolbarButtonId.FLIP_H:
-            draw_flip_icon(cx, cy, icon_r, icon_color)
+        cx = centres[i]
+        rl.DrawCircle(cx, cy, TOOLBAR_BTN_RADIUS, bg_hover if i == toolbar.hover_index else bg_idle)
+        rl.DrawCircleLines(cx, cy, TOOLBAR_BTN_RADIUS, icon_color)
 
-        current_x += TOOLBAR_BTN_RADIUS * 2 + TOOLBAR_BTN_SPACING
+        kind = _ICON_KINDS.get(btn.id)
+        if kind is not None:
+            _draw_icon_lines(_icon_lines(kind, cx, cy, icon_r), icon_color)
 
         if btn.separator_after and i < n_buttons - 1:
-            current_x += separator_width
-            sep_x = current_x - TOOLBAR_BTN_RADIUS - (separator_width + TOOLBAR_BTN_SPACING) // 2
+            sep_x = centres[i + 1] - TOOLBAR_BTN_RADIUS - (separator_width + TOOLBAR_BTN_SPACING) // 2
             sep_alpha = int(150 * alpha)
             rl.DrawLineEx(
                 RL_V2(sep_x, cy - TOOLBAR_BTN_RADIUS * 0.7),
@@ -180,103 +174,119 @@ def draw_toolbar(state: "AppState") -> None:
             )
 
 
-def draw_rotate_icon(cx: int, cy: int, r: float, clockwise: bool, color) -> None:
-    """Draw rotation arrow icon."""
-    segments = 8
+# Icon outlines are fixed line segments. Their geometry (offsets from the
+# button centre) and the raylib Vector2 endpoints are built once per button
+# position and radius instead of re-running the trig every frame.
+_ICON_LINES: dict = {}
+_ICON_LINES_LIMIT = 64
 
-    if clockwise:
-        start_angle = -120
-        arc_span = 270
-        points = []
-        for i in range(segments + 1):
-            angle = math.radians(start_angle + (arc_span * i / segments))
-            points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
-
-        for i in range(len(points) - 1):
-            rl.DrawLineEx(RL_V2(points[i][0], points[i][1]), RL_V2(points[i + 1][0], points[i + 1][1]), 2.0, color)
-
-        end_angle = math.radians(start_angle + arc_span)
-        end_x, end_y = points[-1]
-        arrow_size = r * 0.5
-        tangent_angle = end_angle + math.pi / 2
-    else:
-        start_angle = -60
-        arc_span = 270
-        points = []
-        for i in range(segments + 1):
-            angle = math.radians(start_angle - (arc_span * i / segments))
-            points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
-
-        for i in range(len(points) - 1):
-            rl.DrawLineEx(RL_V2(points[i][0], points[i][1]), RL_V2(points[i + 1][0], points[i + 1][1]), 2.0, color)
-
-        end_angle = math.radians(start_angle - arc_span)
-        end_x, end_y = points[-1]
-        arrow_size = r * 0.5
-        tangent_angle = end_angle - math.pi / 2
-
-    arr_angle1 = tangent_angle + math.radians(150)
-    arr_angle2 = tangent_angle - math.radians(150)
-    rl.DrawLineEx(
-        RL_V2(end_x, end_y),
-        RL_V2(end_x + arrow_size * math.cos(arr_angle1), end_y + arrow_size * math.sin(arr_angle1)),
-        2.0,
-        color,
-    )
-    rl.DrawLineEx(
-        RL_V2(end_x, end_y),
-        RL_V2(end_x + arrow_size * math.cos(arr_angle2), end_y + arrow_size * math.sin(arr_angle2)),
-        2.0,
-        color,
-    )
+_ICON_KINDS = {
+    ToolbarButtonId.SETTINGS: "gear",
+    ToolbarButtonId.ROTATE_CW: "rotate_cw",
+    ToolbarButtonId.ROTATE_CCW: "rotate_ccw",
+    ToolbarButtonId.FLIP_H: "flip",
+}
 
 
-def draw_flip_icon(cx: int, cy: int, r: float, color) -> None:
-    """Draw horizontal flip icon."""
+def _rotate_icon_segments(r: float, clockwise: bool) -> list:
+    segments = 8
+    arc_span = 270
+    start_angle = -120 if clockwise else -60
+    sign = 1 if clockwise else -1
+    points = []
+    for i in range(segments + 1):
+        angle = math.radians(start_angle + sign * (arc_span * i / segments))
+        points.append((r * math.cos(angle), r * math.sin(angle)))
+    lines = [(points[i], points[i + 1]) for i in range(len(points) - 1)]
+
+    end_angle = math.radians(start_angle + sign * arc_span)
+    end_x, end_y = points[-1]
+    arrow_size = r * 0.5
+    tangent_angle = end_angle + sign * math.pi / 2
+    for arr_angle in (tangent_angle + math.radians(150), tangent_angle - math.radians(150)):
+        lines.append(((end_x, end_y), (end_x + arrow_size * math.cos(arr_angle), end_y + arrow_size * math.sin(arr_angle))))
+    return lines
+
+
+def _flip_icon_segments(r: float) -> list:
     arrow_w = r * 0.6
     arrow_h = r * 0.8
     gap = r * 0.15
+    return [
+        ((-gap - arrow_w, 0), (-gap, -arrow_h)),
+        ((-gap - arrow_w, 0), (-gap, arrow_h)),
+        ((-gap, -arrow_h), (-gap, arrow_h)),
+        ((gap + arrow_w, 0), (gap, -arrow_h)),
+        ((gap + arrow_w, 0), (gap, arrow_h)),
+        ((gap, -arrow_h), (gap, arrow_h)),
+    ]
 
-    rl.DrawLineEx(RL_V2(cx - gap - arrow_w, cy), RL_V2(cx - gap, cy - arrow_h), 2.0, color)
-    rl.DrawLineEx(RL_V2(cx - gap - arrow_w, cy), RL_V2(cx - gap, cy + arrow_h), 2.0, color)
-    rl.DrawLineEx(RL_V2(cx - gap, cy - arrow_h), RL_V2(cx - gap, cy + arrow_h), 2.0, color)
-    rl.DrawLineEx(RL_V2(cx + gap + arrow_w, cy), RL_V2(cx + gap, cy - arrow_h), 2.0, color)
-    rl.DrawLineEx(RL_V2(cx + gap + arrow_w, cy), RL_V2(cx + gap, cy + arrow_h), 2.0, color)
-    rl.DrawLineEx(RL_V2(cx + gap, cy - arrow_h), RL_V2(cx + gap, cy + arrow_h), 2.0, color)
 
-
-def draw_gear_icon(cx: int, cy: int, r: float, color) -> None:
-    """Draw gear/settings icon."""
+def _gear_icon_segments(r: float) -> list:
     teeth = 8
     outer_r = r
     inner_r = r * 0.6
     tooth_depth = r * 0.25
+    half_tooth = math.pi / teeth / 2
+    lines = []
 
     for i in range(teeth):
         angle = 2 * math.pi * i / teeth
         next_angle = 2 * math.pi * (i + 0.5) / teeth
-        x1 = cx + (outer_r + tooth_depth) * math.cos(angle - math.pi / teeth / 2)
-        y1 = cy + (outer_r + tooth_depth) * math.sin(angle - math.pi / teeth / 2)
-        x2 = cx + (outer_r + tooth_depth) * math.cos(angle + math.pi / teeth / 2)
-        y2 = cy + (outer_r + tooth_depth) * math.sin(angle + math.pi / teeth / 2)
-        x3 = cx + outer_r * math.cos(angle + math.pi / teeth / 2)
-        y3 = cy + outer_r * math.sin(angle + math.pi / teeth / 2)
-        x4 = cx + outer_r * math.cos(next_angle - math.pi / teeth / 2)
-        y4 = cy + outer_r * math.sin(next_angle - math.pi / teeth / 2)
-
-        rl.DrawLineEx(RL_V2(x1, y1), RL_V2(x2, y2), 2.0, color)
-        rl.DrawLineEx(RL_V2(x2, y2), RL_V2(x3, y3), 2.0, color)
-        rl.DrawLineEx(RL_V2(x3, y3), RL_V2(x4, y4), 2.0, color)
+        p1 = ((outer_r + tooth_depth) * math.cos(angle - half_tooth), (outer_r + tooth_depth) * math.sin(angle - half_tooth))
+        p2 = ((outer_r + tooth_depth) * math.cos(angle + half_tooth), (outer_r + tooth_depth) * math.sin(angle + half_tooth))
+        p3 = (outer_r * math.cos(angle + half_tooth), outer_r * math.sin(angle + half_tooth))
+        p4 = (outer_r * math.cos(next_angle - half_tooth), outer_r * math.sin(next_angle - half_tooth))
+        lines += [(p1, p2), (p2, p3), (p3, p4)]
 
     segments = 16
     for i in range(segments):
         angle1 = 2 * math.pi * i / segments
         angle2 = 2 * math.pi * (i + 1) / segments
-        x1 = cx + inner_r * math.cos(angle1)
-        y1 = cy + inner_r * math.sin(angle1)
-        x2 = cx + inner_r * math.cos(angle2)
-        y2 = cy + inner_r * math.sin(angle2)
-        rl.DrawLineEx(RL_V2(x1, y1), RL_V2(x2, y2), 2.0, color)
+        lines.append((
+            (inner_r * math.cos(angle1), inner_r * math.sin(angle1)),
+            (inner_r * math.cos(angle2), inner_r * math.sin(angle2)),
+        ))
+    return lines
+
+
+def _icon_lines(kind: str, cx: int, cy: int, r: float) -> tuple:
+    key = (kind, cx, cy, r)
+    lines = _ICON_LINES.get(key)
+    if lines is None:
+        if kind == "gear":
+            segments = _gear_icon_segments(r)
+        elif kind == "flip":
+            segments = _flip_icon_segments(r)
+        else:
+            segments = _rotate_icon_segments(r, clockwise=(kind == "rotate_cw"))
+        if len(_ICON_LINES) >= _ICON_LINES_LIMIT:
+            _ICON_LINES.clear()
+        lines = _ICON_LINES[key] = tuple(
+            (RL_V2(cx + x1, cy + y1), RL_V2(cx + x2, cy + y2)) for (x1, y1), (x2, y2) in segments
+        )
+    return lines
+
+
+def _draw_icon_lines(lines: tuple, color) -> None:
+    draw_line = rl.DrawLineEx
+    for start, end in lines:
+        draw_line(start, end, 2.0, color)
+
+
+def draw_rotate_icon(cx: int, cy: int, r: float, clockwise: bool, color) -> None:
+    """Draw rotation arrow icon."""
+    _draw_icon_lines(_icon_lines("rotate_cw" if clockwise else "rotate_ccw", cx, cy, r), color)
+
+
+def draw_flip_icon(cx: int, cy: int, r: float, color) -> None:
+    """Draw horizontal flip icon."""
+    _draw_icon_lines(_icon_lines("flip", cx, cy, r), color)
+
+
+def draw_gear_icon(cx: int, cy: int, r: float, color) -> None:
+    """Draw gear/settings icon."""
+    _draw_icon_lines(_icon_lines("gear", cx, cy, r), color)
 
 
 def _buttons_width(state: "AppState") -> int:
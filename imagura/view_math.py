@@ -1,10 +1,9 @@
 """Pure view calculation functions - no side effects, no state mutation."""
 
 from __future__ import annotations
-from typing import Tuple
+from typing import Optional, Tuple
 
 from .types import ViewParams, TextureInfo
-from .math_utils import clamp
 from .logging import log
 
 
@@ -58,6 +57,39 @@ def center_view_for(
     )
 
 
+def lerp_view(
+    a: ViewParams,
+    b: ViewParams,
+    t: float,
+    out: Optional[ViewParams] = None
+) -> ViewParams:
+    """Interpolate between two views by factor t (clamped to [0, 1]).
+
+    Equivalent to three ``lerp`` calls, but clamps t once and builds the
+    result directly; animation tweens call this every frame.
+
+    Args:
+        a: View at t=0.
+        b: View at t=1.
+        t: Interpolation factor.
+        out: Optional view to fill in place instead of allocating one.
+
+    Returns:
+        Interpolated ViewParams (``out`` when given).
+    """
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    scale = a.scale + (b.scale - a.scale) * t
+    offx = a.offx + (b.offx - a.offx) * t
+    offy = a.offy + (b.offy - a.offy) * t
+    if out is None:
+        return ViewParams(scale=scale, offx=offx, offy=offy)
+    out.scale, out.offx, out.offy = scale, offx, offy
+    return out
+
+
 def compute_fit_view(
     img_w: int,
     img_h: int,
@@ -106,15 +138,24 @@ def clamp_pan(
     Returns:
         New ViewParams with clamped offsets.
     """
-    result = view.copy()
-    vw = img_w * view.scale
-    vh = img_h * view.scale
+    offx, offy = _clamped_offsets(view.scale, view.offx, view.offy, img_w, img_h, screen_w, screen_h)
+    return ViewParams(view.scale, offx, offy)
 
-    # Calculate current image center
-    img_center_x = view.offx + vw / 2
-    img_center_y = view.offy + vh / 2
-    screen_center_x = screen_w / 2
-    screen_center_y = screen_h / 2
+
+def _clamped_offsets(
+    scale: float,
+    offx: float,
+    offy: float,
+    img_w: int,
+    img_h: int,
+    screen_w: int,
+    screen_h: int
+) -> Tuple[float, float]:
+    """Scalar core of clamp_pan: the clamped (offx, offy) for a view."""
+    vw = img_w * scale
+    vh = img_h * scale
+    half_w = vw / 2
+    half_h = vh / 2
 
     # How far can image center deviate from screen center?
     # For small image: center must stay within [vw/2, screen_w - vw/2]
@@ -122,20 +163,24 @@ def clamp_pan(
     #   => max deviation = (screen_w - vw) / 2
     # For large image: center can go to [screen_w - vw/2, vw/2] to show edges
     #   => max deviation = (vw - screen_w) / 2
-
     # Unified: max deviation = abs(screen_w - vw) / 2
     max_dev_x = abs(screen_w - vw) / 2
     max_dev_y = abs(screen_h - vh) / 2
 
-    # Clamp image center position
-    clamped_center_x = clamp(img_center_x, screen_center_x - max_dev_x, screen_center_x + max_dev_x)
-    clamped_center_y = clamp(img_center_y, screen_center_y - max_dev_y, screen_center_y + max_dev_y)
+    # Clamp the image center around the screen center (clamp() inlined: this
+    # runs every frame while zooming or panning).
+    cx = offx + half_w
+    lo = screen_w / 2 - max_dev_x
+    hi = screen_w / 2 + max_dev_x
+    cx = lo if cx < lo else hi if cx > hi else cx
 
-    # Convert back to offset
-    result.offx = clamped_center_x - vw / 2
-    result.offy = clamped_center_y - vh / 2
+    cy = offy + half_h
+    lo = screen_h / 2 - max_dev_y
+    hi = screen_h / 2 + max_dev_y
+    cy = lo if cy < lo else hi if cy > hi else cy
 
-    return result
+    # Convert back to offset
+    return cx - half_w, cy - half_h
 
 
 def recompute_view_anchor_zoom(
@@ -174,6 +219,28 @@ def recompute_view_anchor_zoom(
     return result
 
 
+def recompute_view_anchor_zoom_clamped(
+    view: ViewParams,
+    new_scale: float,
+    anchor: Tuple[int, int],
+    img_w: int,
+    img_h: int,
+    screen_w: int,
+    screen_h: int
+) -> ViewParams:
+    """Anchor-preserving zoom followed by clamp_pan, without the intermediate view.
+
+    Same result as ``clamp_pan(recompute_view_anchor_zoom(...), ...)``.
+    """
+    ax, ay = anchor
+    old_scale = view.scale if view.scale and view.scale > 1e-6 else 1e-6
+    scale = max(0.01, float(new_scale))
+    offx = ax - (ax - view.offx) / old_scale * scale
+    offy = ay - (ay - view.offy) / old_scale * scale
+    offx, offy = _clamped_offsets(scale, offx, offy, img_w, img_h, screen_w, screen_h)
+    return ViewParams(scale, offx, offy)
+
+
 def view_for_1to1_centered(
     img_w: int,
     img_h: int,
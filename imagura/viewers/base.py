@@ -64,6 +64,7 @@ class ContentViewer(Protocol):
 
     # === Texture (main thread) ===
     def to_texture(self, cpu_data: Any, path: str) -> TextureInfo: ...
+    def prepare_thumbnail(self, cpu_data: Any, target_h: int) -> Any: ...
     def make_thumbnail(self, cpu_data: Any, target_h: int, path: str) -> BitmapThumb: ...
 
     # === Metadata ===
@@ -91,6 +92,14 @@ class BaseViewer:
     def load_cpu(self, path: str) -> Any:
         raise NotImplementedError
 
+    def load_cpu_thumbnail(self, path: str, target_h: int) -> Any:
+        """Load CPU data for a thumbnail of height ``target_h``.
+
+        Default: the full load_cpu; prepare_thumbnail downscales it afterwards.
+        Viewers whose decoder can scale on decode override this.
+        """
+        return self.load_cpu(path)
+
     # --- Texture ---
 
     def to_texture(self, cpu_data: Any, path: str) -> TextureInfo:
@@ -105,6 +114,17 @@ class BaseViewer:
             pass
         return TextureInfo(tex=tex, w=w, h=h, path=path)
 
+    def prepare_thumbnail(self, cpu_data: Any, target_h: int) -> Any:
+        """Worker-thread half of make_thumbnail: downscale to target_h (no GPU).
+
+        Default: resize the raylib Image so make_thumbnail only uploads it.
+        """
+        img = cpu_data
+        w, h = img.width, img.height
+        if w <= 0 or h <= 0 or h <= target_h:
+            return img
+        return _thumbnail_resize(img, max(1, int(w * target_h / h)), target_h)
+
     def make_thumbnail(self, cpu_data: Any, target_h: int, path: str) -> BitmapThumb:
         """Default: resize raylib Image to target_h, upload to GPU."""
         img = cpu_data
@@ -115,7 +135,7 @@ class BaseViewer:
 
             scale = target_h / h
             tw, th = max(1, int(w * scale)), target_h
-            rimg = _image_resize_mut(img, tw, th)
+            rimg = _thumbnail_resize(img, tw, th)
 
             tex = rl.LoadTextureFromImage(rimg)
             rl.SetTextureFilter(tex, 1)
@@ -166,40 +186,107 @@ class BaseViewer:
             pass
 
 
-def _image_resize_mut(img, w: int, h: int):
-    """Resize a raylib Image in-place. Handles both CFFI and ctypes bindings."""
-    import ctypes
-    if hasattr(rl, 'ffi'):
-        try:
-            p = rl.ffi.new("Image *", img)
+# The binding is fixed for the process; resolved once instead of per call.
+_RL_IS_CFFI = hasattr(rl, "ffi")
+
+# ctypes bindings differ in whether ImageResize takes a pointer or the struct.
+_RESIZE_CALLS = (
+    lambda im, w, h: rl.ImageResize(ctypes.byref(im), w, h),
+    lambda im, w, h: rl.ImageResize(im, w, h),
+    lambda im, w, h: rl.ImageResizeNN(ctypes.byref(im), w, h),
+    lambda im, w, h: rl.ImageResizeNN(im, w, h),
+)
+# Index of the call form that last worked, per ``nearest`` flag.
+_resize_call_ok: dict = {}
+
+
+def _image_resize_mut_cffi(img, w: int, h: int, nearest: bool = False):
+    try:
+        p = rl.ffi.new("Image *", img)
+        if nearest:
+            rl.ImageResizeNN(p, int(w), int(h))
+        else:
             try:
                 rl.ImageResize(p, int(w), int(h))
             except Exception:
                 rl.ImageResizeNN(p, int(w), int(h))
-            return p[0]
+        return p[0]
+    except Exception:
+        return _image_resize_mut_ctypes(img, w, h, nearest)
+
+
+def _image_resize_mut_ctypes(img, w: int, h: int, nearest: bool = False):
+    w, h = int(w), int(h)
+    first = 2 if nearest else 0
+    known = _resize_call_ok.get(nearest)
+    if known is not None:
+        try:
+            _RESIZE_CALLS[known](img, w, h)
+            return img
         except Exception:
             pass
-    for fn in (
-            lambda im: rl.ImageResize(ctypes.byref(im), int(w), int(h)),
-            lambda im: rl.ImageResize(im, int(w), int(h)),
-            lambda im: rl.ImageResizeNN(ctypes.byref(im), int(w), int(h)),
-            lambda im: rl.ImageResizeNN(im, int(w), int(h)),
-    ):
+    for idx in range(first, len(_RESIZE_CALLS)):
+        if idx == known:
+            continue
         try:
-            fn(img)
+            _RESIZE_CALLS[idx](img, w, h)
+            _resize_call_ok[nearest] = idx
             return img
         except Exception:
             continue
     return img
 
 
+# Resize a raylib Image in-place for the active binding. ``nearest`` selects
+# ImageResizeNN (touches only output pixels) instead of the filtered
+# ImageResize (touches every source pixel).
+_image_resize_mut = _image_resize_mut_cffi if _RL_IS_CFFI else _image_resize_mut_ctypes
+
+
+# Source images larger than this multiple of the thumbnail size get a
+# nearest-neighbour pre-shrink before the filtered resize. Keeping 4x4 point
+# samples per output pixel leaves the filtered pass enough to average that
+# fine detail (text, fabric, foliage) does not alias in the gallery.
+_THUMB_PRESHRINK_FACTOR = 4
+
+
+def _thumbnail_resize(img, tw: int, th: int):
+    """Downscale a raylib Image to thumbnail size.
+
+    The filtered ImageResize reads every source pixel, which dominates thumb
+    building for camera-sized images. A nearest-neighbour gather down to
+    ``_THUMB_PRESHRINK_FACTOR`` x the target first bounds the filtered pass
+    to a small multiple of the thumbnail size.
+    """
+    if img.width == tw and img.height == th:
+        return img
+    k = _THUMB_PRESHRINK_FACTOR
+    if img.width > tw * k and img.height > th * k:
+        img = _image_resize_mut(img, tw * k, th * k, nearest=True)
+    return _image_resize_mut(img, tw, th)
+
+
 def load_image_from_memory(file_type: str, data: bytes) -> Any:
-    """Load raylib Image from in-memory bytes. Handles CFFI and ctypes bindings."""
+    """Load raylib Image from in-memory bytes. Handles CFFI and ctypes bindings.
+
+    ``data`` may be any buffer (bytes, mmap). With CFFI the buffer is passed
+    to the decoder without copying; raylib does not keep it after decoding.
+    """
     ft = file_type.encode("utf-8") if isinstance(file_type, str) else file_type
 
-    if hasattr(rl, "ffi"):
-        c_data = rl.ffi.new("unsigned char[]", data)
-        return rl.LoadImageFromMemory(ft, c_data, len(data))
+    if _RL_IS_CFFI:
+        ffi = rl.ffi
+        try:
+            c_data = ffi.from_buffer("unsigned char[]", data)
+        except (TypeError, AttributeError):
+            c_data = ffi.new("unsigned char[]", bytes(data))
+        try:
+            return rl.LoadImageFromMemory(ft, c_data, len(data))
+        finally:
+            # Drop the buffer export now so an mmap source can be closed.
+            release = getattr(ffi, "release", None)
+            if release is not None:
+                release(c_data)
 
     c_data = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
     try:
@@ -210,7 +297,7 @@ def load_image_from_memory(file_type: str, data: bytes) -> Any:
 
 def update_texture_rgba(tex: Any, rgba_bytes: bytes) -> None:
     """Update existing GPU texture with new RGBA pixel data."""
-    if hasattr(rl, "ffi"):
+    if _RL_IS_CFFI:
         c_data = rl.ffi.from_buffer(bytearray(rgba_bytes))
         rl.UpdateTexture(tex, c_data)
     else:
@@ -19,7 +19,7 @@ from ..rl_compat import rl
 from ..logging import log
 from ..types import TextureInfo, BitmapThumb
 
-from .base import BaseViewer, Playback, load_image_from_memory, update_texture_rgba, _image_resize_mut
+from .base import BaseViewer, Playback, load_image_from_memory, update_texture_rgba, _thumbnail_resize
 
 
 @dataclass
@@ -147,6 +147,10 @@ class GifViewer(BaseViewer):
         cpu_data._tex_ref = tex
         return TextureInfo(tex=tex, w=w, h=h, path=path)
 
+    def prepare_thumbnail(self, cpu_data: Any, target_h: int) -> Any:
+        # GifCpuData is not a raylib Image; make_thumbnail picks the frame.
+        return cpu_data
+
     def make_thumbnail(self, cpu_data: Any, target_h: int, path: str) -> BitmapThumb:
         img = cpu_data.first_frame_img
         if img is None:
@@ -163,7 +167,7 @@ class GifViewer(BaseViewer):
                 return BitmapThumb(None, (0, 0), path, False)
             scale = target_h / h
             tw, th = max(1, int(w * scale)), target_h
-            rimg = _image_resize_mut(img, tw, th)
+            rimg = _thumbnail_resize(img, tw, th)
             tex = rl.LoadTextureFromImage(rimg)
             rl.SetTextureFilter(tex, 1)
             try:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+import mmap
 import os
 from typing import Any, Optional, Tuple
 
@@ -11,6 +13,9 @@ from ..image_utils import probe_image_dimensions
 
 from .base import BaseViewer, _image_resize_mut, load_image_from_memory
 
+# libjpeg can decode straight to 1/2, 1/4 or 1/8 scale (PIL's draft mode).
+_DRAFT_EXTS = frozenset({".jpg", ".jpeg"})
+
 
 class ImageViewer(BaseViewer):
     """Viewer for static raster images loaded via raylib."""
@@ -32,7 +37,17 @@ class ImageViewer(BaseViewer):
 
         ext = os.path.splitext(path)[1].lower()
         with open(path, "rb") as file:
-            img = load_image_from_memory(ext, file.read())
+            # Map the file instead of reading it into a bytes copy; empty or
+            # unmappable files fall back to a plain read.
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                mapped = None
+            if mapped is None:
+                img = load_image_from_memory(ext, file.read())
+            else:
+                with mapped:
+                    img = load_image_from_memory(ext, mapped)
 
         w, h = img.width, img.height
         if w <= 0 or h <= 0:
@@ -47,6 +62,38 @@ class ImageViewer(BaseViewer):
 
         return img
 
+    def load_cpu_thumbnail(self, path: str, target_h: int) -> Any:
+        """JPEG thumbnails decode at reduced scale instead of full resolution.
+
+        PIL's draft mode makes libjpeg skip most of the IDCT work and never
+        allocates the full-size buffer; the small result is handed to raylib
+        as an uncompressed PNG, like the WebP viewer does.
+        """
+        if os.path.splitext(path)[1].lower() not in _DRAFT_EXTS:
+            return self.load_cpu(path)
+        try:
+            from PIL import Image as PILImage
+        except ImportError:
+            return self.load_cpu(path)
+
+        file_size_mb = os.path.getsize(path) / (1024 * 1024)
+        if file_size_mb > MAX_FILE_SIZE_MB:
+            raise RuntimeError(f"file too large: {file_size_mb:.1f}MB")
+
+        with PILImage.open(path) as pil_img:
+            w, h = pil_img.size
+            if w <= 0 or h <= 0:
+                raise RuntimeError("empty image")
+            size = (max(1, int(w * target_h / h)), target_h)
+            pil_img.draft("RGB", size)
+            small = pil_img.convert("RGB")
+        small.thumbnail(size, PILImage.Resampling.BILINEAR)
+
+        buf = io.BytesIO()
+        small.save(buf, format="PNG", compress_level=0)
+        small.close()
+        return load_image_from_memory(".png", buf.getvalue())
+
     # --- Metadata ---
 
     def probe_dimensions(self, path: str) -> Optional[Tuple[int, int]]:
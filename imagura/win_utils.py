@@ -3,8 +3,142 @@
 from __future__ import annotations
 import sys
 import ctypes
+from collections import OrderedDict
 from typing import Optional, Tuple
 
+# Platform is fixed for the life of the process; helpers test this constant
+# instead of comparing sys.platform on every call.
+_IS_WIN32 = sys.platform == 'win32'
+
+
+# Layouts mirror the user32 ABI and must keep natural alignment: ACCENT_POLICY
+# is four 4-byte fields (no padding to trim), and the 4 bytes after
+# WINDOWCOMPOSITIONATTRIBDATA.Attribute on x64 are required before the
+# pointer, so neither struct may declare _pack_. Both are used as the
+# import-time singletons _ACCENT / _WCA below.
+class ACCENT_POLICY(ctypes.Structure):
+    _fields_ = [
+        ("AccentState", ctypes.c_int),
+        ("AccentFlags", ctypes.c_int),
+        ("GradientColor", ctypes.c_uint),
+        ("AnimationId", ctypes.c_int),
+    ]
+
+
+class WINDOWCOMPOSITIONATTRIBDATA(ctypes.Structure):
+    _fields_ = [
+        ("Attribute", ctypes.c_int),
+        ("Data", ctypes.c_void_p),
+        ("SizeOfData", ctypes.c_size_t),
+    ]
+
+
+WCA_ACCENT_POLICY = 19
+
+# Struct sizes are fixed by the layout above; computed once instead of per call.
+_ACCENT_POLICY_SIZE = ctypes.sizeof(ACCENT_POLICY)
+_C_INT_SIZE = ctypes.sizeof(ctypes.c_int)
+
+# Reusable composition-attribute payload. Blur is only toggled from the main
+# thread, so _set_composition_attribute mutates these in place per call.
+_ACCENT = ACCENT_POLICY()
+_WCA = WINDOWCOMPOSITIONATTRIBDATA()
+_WCA.Attribute = WCA_ACCENT_POLICY
+_WCA.Data = ctypes.addressof(_ACCENT)
+_WCA.SizeOfData = _ACCENT_POLICY_SIZE
+_WCA_PTR = ctypes.byref(_WCA)
+
+class MARGINS(ctypes.Structure):
+    _fields_ = [
+        ("cxLeftWidth", ctypes.c_int),
+        ("cxRightWidth", ctypes.c_int),
+        ("cyTopHeight", ctypes.c_int),
+        ("cyBottomHeight", ctypes.c_int),
+    ]
+
+
+_MARGINS_EXTEND = MARGINS(-1, -1, -1, -1)  # Extend to entire window
+_MARGINS_RESET = MARGINS(0, 0, 0, 0)  # Reset to normal
+_MARGINS_EXTEND_PTR = ctypes.byref(_MARGINS_EXTEND)
+_MARGINS_RESET_PTR = ctypes.byref(_MARGINS_RESET)
+
+# Reusable int payload for DwmSetWindowAttribute; callers only set .value.
+_DWM_ATTR_VALUE = ctypes.c_int()
+_DWM_ATTR_PTR = ctypes.byref(_DWM_ATTR_VALUE)
+
+
+def _read_windows_build() -> int:
+    """Read the Windows build number from the registry (0 when unavailable)."""
+    if not _IS_WIN32:
+        return 0
+    try:
+        import winreg
+        key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                             r"SOFTWARE\Microsoft\Windows NT\CurrentVersion")
+        build = winreg.QueryValueEx(key, "CurrentBuildNumber")[0]
+        winreg.CloseKey(key)
+        return int(build)
+    except Exception:
+        return 0
+
+
+# The OS build cannot change while the process runs, so probe it once. The
+# system-backdrop attribute only exists on Windows 11; older builds skip it.
+_WINDOWS_BUILD = _read_windows_build()
+_IS_WIN11 = _WINDOWS_BUILD >= 22000
+
+# DWM attributes that only exist on Windows 11 (DWMWA_SYSTEMBACKDROP_TYPE and
+# the undocumented DWMWA_MICA_EFFECT). Setting them earlier always fails, so
+# _set_window_attribute returns before resolving dwmapi at all.
+_WIN11_ONLY_ATTRIBUTES = frozenset((38, 1029))
+
+_dwm_set_window_attribute_fn = None
+_dwm_extend_frame_fn = None
+_set_composition_fn = None
+_set_composition_resolved = False
+
+
+def _dwm_set_window_attribute():
+    """Return a typed DwmSetWindowAttribute pointer, bound on first use.
+
+    Binding once through WINFUNCTYPE skips the WinDLL attribute lookup on every
+    call. It stays lazy so dwmapi is only loaded when an attribute is set.
+    """
+    global _dwm_set_window_attribute_fn
+    if _dwm_set_window_attribute_fn is None:
+        prototype = ctypes.WINFUNCTYPE(
+            ctypes.c_long, ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p, ctypes.c_uint
+        )
+        _dwm_set_window_attribute_fn = prototype(("DwmSetWindowAttribute", ctypes.windll.dwmapi))
+    return _dwm_set_window_attribute_fn
+
+
+def _dwm_extend_frame_into_client():
+    """Return DwmExtendFrameIntoClientArea, resolved on first use."""
+    global _dwm_extend_frame_fn
+    if _dwm_extend_frame_fn is None:
+        _dwm_extend_frame_fn = ctypes.windll.dwmapi.DwmExtendFrameIntoClientArea
+    return _dwm_extend_frame_fn
+
+
+def _set_window_composition_attribute():
+    """Return user32.SetWindowCompositionAttribute, or None if the export is missing.
+
+    The export is undocumented, so a missing entry point is cached as None
+    rather than probed again on every blur toggle.
+    """
+    global _set_composition_fn, _set_composition_resolved
+    if not _set_composition_resolved:
+        _set_composition_fn = getattr(ctypes.windll.user32, 'SetWindowCompositionAttribute', None)
+        _set_composition_resolved = True
+    return _set_composition_fn
+
+
+# Successful long -> 8.3 conversions for this session. Failures are not cached:
+# GetShortPathNameW fails for files that do not exist yet.
+_SHORT_PATH_CACHE_LIMIT = 1024
+_short_path_cache: "OrderedDict[str, str]" = OrderedDict()
+
 
 def get_short_path_name(long_path: str) -> str:
     """Convert a long path to 8.3 short path format (Windows only).
@@ -12,9 +146,13 @@ def get_short_path_name(long_path: str) -> str:
     This helps with paths containing unicode characters that some
     C libraries can't handle properly.
     """
-    if sys.platform != 'win32':
+    if not _IS_WIN32:
         return long_path
 
+    cached = _short_path_cache.get(long_path)
+    if cached is not None:
+        return cached
+
     try:
         from ctypes import wintypes
 
@@ -29,7 +167,11 @@ def get_short_path_name(long_path: str) -> str:
             if needed == 0:
                 return long_path
             if needed <= output_buf_size:
-                return output_buf.value
+                short_path = output_buf.value
+                _short_path_cache[long_path] = short_path
+                while len(_short_path_cache) > _SHORT_PATH_CACHE_LIMIT:
+                    _short_path_cache.popitem(last=False)
+                return short_path
             output_buf_size = needed
     except Exception:
         return long_path
@@ -41,7 +183,7 @@ def get_work_area() -> Tuple[int, int, int, int]:
     Returns:
         Tuple of (x, y, width, height). Returns (0, 0, 0, 0) on failure.
     """
-    if sys.platform != 'win32':
+    if not _IS_WIN32:
         return 0, 0, 0, 0
 
     try:
@@ -89,23 +231,13 @@ class WinBlur:
 
     @staticmethod
     def _get_windows_build() -> int:
-        """Get Windows build number."""
-        if sys.platform != 'win32':
-            return 0
-        try:
-            import winreg
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                                 r"SOFTWARE\Microsoft\Windows NT\CurrentVersion")
-            build = winreg.QueryValueEx(key, "CurrentBuildNumber")[0]
-            winreg.CloseKey(key)
-            return int(build)
-        except Exception:
-            return 0
+        """Get Windows build number (probed once at import)."""
+        return _WINDOWS_BUILD
 
     @staticmethod
     def _set_window_ex_style(hwnd: int, add_style: int) -> bool:
         """Add extended window style."""
-        if sys.platform != 'win32':
+        if not _IS_WIN32:
             return False
         try:
             user32 = ctypes.windll.user32
@@ -119,17 +251,13 @@ class WinBlur:
     @staticmethod
     def _set_window_attribute(hwnd: int, attr: int, value: int) -> bool:
         """Set a DWM window attribute."""
-        if sys.platform != 'win32':
+        if not _IS_WIN32:
+            return False
+        if attr in _WIN11_ONLY_ATTRIBUTES and not _IS_WIN11:
             return False
         try:
-            dwmapi = ctypes.windll.dwmapi
-            val = ctypes.c_int(value)
-            res = dwmapi.DwmSetWindowAttribute(
-                ctypes.c_void_p(hwnd),
-                ctypes.c_uint(attr),
-                ctypes.byref(val),
-                ctypes.sizeof(val)
-            )
+            _DWM_ATTR_VALUE.value = value
+            res = _dwm_set_window_attribute()(hwnd, attr, _DWM_ATTR_PTR, _C_INT_SIZE)
             return res == 0
         except Exception:
             return False
@@ -137,27 +265,11 @@ class WinBlur:
     @staticmethod
     def _extend_frame_into_client(hwnd: int, extend: bool = True) -> bool:
         """Extend or reset window frame into client area."""
-        if sys.platform != 'win32':
+        if not _IS_WIN32:
             return False
         try:
-            dwmapi = ctypes.windll.dwmapi
-
-            class MARGINS(ctypes.Structure):
-                _fields_ = [
-                    ("cxLeftWidth", ctypes.c_int),
-                    ("cxRightWidth", ctypes.c_int),
-                    ("cyTopHeight", ctypes.c_int),
-                    ("cyBottomHeight", ctypes.c_int),
-                ]
-
-            if extend:
-                margins = MARGINS(-1, -1, -1, -1)  # Extend to entire window
-            else:
-                margins = MARGINS(0, 0, 0, 0)  # Reset to normal
-            res = dwmapi.DwmExtendFrameIntoClientArea(
-                ctypes.c_void_p(hwnd),
-                ctypes.byref(margins)
-            )
+            margins = _MARGINS_EXTEND_PTR if extend else _MARGINS_RESET_PTR
+            res = _dwm_extend_frame_into_client()(ctypes.c_void_p(hwnd), margins)
             return res == 0
         except Exception:
             return False
@@ -165,42 +277,16 @@ class WinBlur:
     @staticmethod
     def _set_composition_attribute(hwnd: int, accent_state: int, gradient_color: int = 0, accent_flags: int = 2) -> bool:
         """Set Windows composition attribute with specified accent state."""
-        if sys.platform != 'win32':
+        if not _IS_WIN32:
             return False
         try:
-            user32 = ctypes.windll.user32
-
-            class ACCENT_POLICY(ctypes.Structure):
-                _fields_ = [
-                    ("AccentState", ctypes.c_int),
-                    ("AccentFlags", ctypes.c_int),
-                    ("GradientColor", ctypes.c_uint),
-                    ("AnimationId", ctypes.c_int),
-                ]
-
-            class WINDOWCOMPOSITIONATTRIBDATA(ctypes.Structure):
-                _fields_ = [
-                    ("Attribute", ctypes.c_int),
-                    ("Data", ctypes.c_void_p),
-                    ("SizeOfData", ctypes.c_size_t),
-                ]
-
-            WCA_ACCENT_POLICY = 19
-
-            accent = ACCENT_POLICY()
-            accent.AccentState = accent_state
-            accent.AccentFlags = accent_flags if accent_state != 0 else 0
-            accent.GradientColor = gradient_color
-            accent.AnimationId = 0
-
-            data = WINDOWCOMPOSITIONATTRIBDATA()
-            data.Attribute = WCA_ACCENT_POLICY
-            data.Data = ctypes.addressof(accent)
-            data.SizeOfData = ctypes.sizeof(accent)
+            _ACCENT.AccentState = accent_state
+            _ACCENT.AccentFlags = accent_flags if accent_state != 0 else 0
+            _ACCENT.GradientColor = gradient_color
 
-            SetWindowCompositionAttribute = getattr(user32, 'SetWindowCompositionAttribute', None)
+            SetWindowCompositionAttribute = _set_window_composition_attribute()
             if SetWindowCompositionAttribute:
-                result = SetWindowCompositionAttribute(ctypes.c_void_p(hwnd), ctypes.byref(data))
+                result = SetWindowCompositionAttribute(ctypes.c_void_p(hwnd), _WCA_PTR)
                 return result != 0
             return False
         except Exception:
@@ -209,7 +295,7 @@ class WinBlur:
     @staticmethod
     def _enable_blur_behind(hwnd: int, enable: bool = True) -> bool:
         """Enable blur behind window using DwmEnableBlurBehindWindow (Vista/7 API)."""
-        if sys.platform != 'win32':
+        if not _IS_WIN32:
             return False
         try:
             dwmapi = ctypes.windll.dwmapi
@@ -377,7 +463,7 @@ class WinBlur:
         # Disable composition attribute
         cls._set_composition_attribute(hwnd, cls.ACCENT_DISABLED, 0)
 
-        # Disable backdrop
+        # Disable backdrop (a no-op before Windows 11)
         cls._set_window_attribute(hwnd, cls.DWMWA_SYSTEMBACKDROP_TYPE, cls.DWMSBT_NONE)
 
         # Reset frame extension
@@ -391,16 +477,14 @@ def set_titlebar_dark(hwnd: Optional[int], dark: bool = True) -> bool:
     Only visible in windowed/decorated mode; harmless in borderless fullscreen.
     No-op on non-Windows or unsupported builds.
     """
-    if not hwnd or sys.platform != 'win32':
+    if not hwnd or not _IS_WIN32:
         return False
     try:
-        dwmapi = ctypes.windll.dwmapi
-        val = ctypes.c_int(1 if dark else 0)
+        set_attribute = _dwm_set_window_attribute()
+        _DWM_ATTR_VALUE.value = 1 if dark else 0
         # attr 20 on Win10 1809+/Win11; attr 19 on the original 1809 build.
         for attr in (20, 19):
-            res = dwmapi.DwmSetWindowAttribute(
-                ctypes.c_void_p(hwnd), ctypes.c_uint(attr),
-                ctypes.byref(val), ctypes.sizeof(val))
+            res = set_attribute(hwnd, attr, _DWM_ATTR_PTR, _C_INT_SIZE)
             if res == 0:
                 return True
         return False
@@ -408,21 +492,38 @@ def set_titlebar_dark(hwnd: Optional[int], dark: bool = True) -> bool:
         return False
 
 
+def _window_handle_to_int(rl, handle) -> int:
+    """Extract the integer address from a binding's window-handle value.
+
+    Avoids a ctypes.cast round trip: plain ints and ctypes c_void_p expose the
+    address directly, and CFFI pointers go through ffi.cast("uintptr_t").
+    """
+    if not handle:
+        return 0
+    if isinstance(handle, int):
+        return handle
+    if isinstance(handle, ctypes.c_void_p):
+        return handle.value or 0
+    ffi = getattr(rl, "ffi", None)
+    if ffi is not None:
+        return int(ffi.cast("uintptr_t", handle))
+    return int(ctypes.cast(handle, ctypes.c_void_p).value or 0)
+
+
 def get_window_handle_from_raylib() -> Optional[int]:
     """Get HWND from raylib window."""
     try:
         # Import here to avoid circular dependency
         from .rl_compat import rl
 
-        if hasattr(rl, "get_window_handle"):
-            return int(ctypes.cast(rl.get_window_handle(), ctypes.c_void_p).value or 0)
-        if hasattr(rl, "GetWindowHandle"):
-            return int(ctypes.cast(rl.GetWindowHandle(), ctypes.c_void_p).value or 0)
+        getter = getattr(rl, "get_window_handle", None) or getattr(rl, "GetWindowHandle", None)
+        if getter is not None:
+            return _window_handle_to_int(rl, getter())
     except Exception:
         pass
 
     # Fallback: find by window title
-    if sys.platform == 'win32':
+    if _IS_WIN32:
         try:
             user32 = ctypes.windll.user32
             user32.FindWindowW.restype = ctypes.c_void_p
@@ -437,3 +538,36 @@ def get_window_handle_from_raylib() -> Optional[int]:
             pass
 
     return None
+
+
+# ── Non-Windows dispatch ─────────────────────────────────────────────────────
+# Resolve the platform once: off Windows every helper above is a fixed no-op,
+# so rebind the public names to trivial stubs instead of re-checking per call.
+
+def _short_path_passthrough(long_path: str) -> str:
+    return long_path
+
+
+def _no_work_area() -> Tuple[int, int, int, int]:
+    return 0, 0, 0, 0
+
+
+def _no_blur(hwnd: Optional[int]) -> None:
+    return None
+
+
+def _no_titlebar(hwnd: Optional[int], dark: bool = True) -> bool:
+    return False
+
+
+def _no_window_handle() -> Optional[int]:
+    return None
+
+
+if not _IS_WIN32:
+    get_short_path_name = _short_path_passthrough
+    get_work_area = _no_work_area
+    set_titlebar_dark = _no_titlebar
+    get_window_handle_from_raylib = _no_window_handle
+    WinBlur.enable = staticmethod(_no_blur)
+    WinBlur.disable = staticmethod(_no_blur)
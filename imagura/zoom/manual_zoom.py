@@ -5,8 +5,7 @@ from __future__ import annotations
 from typing import Callable, Tuple
 
 from ..types import ViewParams
-from ..view_math import clamp_pan as clamp_pan_pure
-from ..view_math import recompute_view_anchor_zoom as anchor_zoom_pure
+from ..view_math import recompute_view_anchor_zoom_clamped
 
 
 def apply_manual_zoom(
@@ -33,8 +32,9 @@ def apply_manual_zoom(
     # down to 50% of real size instead of jumping.
     min_scale = min(state.last_fit_view.scale, 1.0) * 0.5
     new_scale = max(min_scale, min(state.view.scale * scale_multiplier, max_zoom))
-    target = anchor_zoom_pure(state.view, new_scale, anchor, texture.w, texture.h)
-    target = clamp_pan_pure(target, texture.w, texture.h, state.screenW, state.screenH)
+    target = recompute_view_anchor_zoom_clamped(
+        state.view, new_scale, anchor, texture.w, texture.h, state.screenW, state.screenH
+    )
 
     start_zoom_animation(state, target)
     trigger_scale_overlay(state)
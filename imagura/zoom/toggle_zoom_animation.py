@@ -5,9 +5,10 @@ from __future__ import annotations
 from typing import Callable
 
 from ..logging import log
-from ..math_utils import ease_in_out_cubic, lerp
+from ..math_utils import ease_in_out_cubic
 from ..types import ViewParams
 from ..view_math import clamp_pan as clamp_pan_pure
+from ..view_math import lerp_view
 from ..view_math import view_for_1to1_centered as view_1to1_pure
 
 
@@ -66,11 +67,7 @@ class ToggleZoomAnimationController:
             return
 
         t_eased = ease_in_out_cubic(t)
-        current = ViewParams(
-            scale=lerp(state.toggle_zoom_from.scale, state.toggle_zoom_to.scale, t_eased),
-            offx=lerp(state.toggle_zoom_from.offx, state.toggle_zoom_to.offx, t_eased),
-            offy=lerp(state.toggle_zoom_from.offy, state.toggle_zoom_to.offy, t_eased),
-        )
+        current = lerp_view(state.toggle_zoom_from, state.toggle_zoom_to, t_eased)
         state.view = clamp_pan_pure(current, ti.w, ti.h, state.screenW, state.screenH)
 
     def _target_view_for_state(self, state, next_state: int, ti) -> ViewParams:
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from typing import Callable
 
-from ..math_utils import ease_out_quad, lerp
+from ..math_utils import ease_out_quad
 from ..types import ViewParams
 from ..view_math import clamp_pan as clamp_pan_pure
+from ..view_math import lerp_view
 
 
 class ZoomAnimationController:
@@ -37,8 +38,4 @@ class ZoomAnimationController:
             return
 
         t_eased = ease_out_quad(t)
-        state.view = ViewParams(
-            scale=lerp(state.zoom_anim_from.scale, state.zoom_anim_to.scale, t_eased),
-            offx=lerp(state.zoom_anim_from.offx, state.zoom_anim_to.offx, t_eased),
-            offy=lerp(state.zoom_anim_from.offy, state.zoom_anim_to.offy, t_eased),
-        )
+        state.view = lerp_view(state.zoom_anim_from, state.zoom_anim_to, t_eased)
@@ -12,7 +12,7 @@ import math
 # Import from new modules
 import imagura.config as cfg  # For dynamic access to config values
 from imagura.config import (
-    TARGET_FPS, ASYNC_WORKERS,
+    TARGET_FPS, ASYNC_WORKERS, REDRAW_SETTLE_SECONDS, UI_EVENT_BUDGET_MS,
     ANIM_SWITCH_KEYS_MS, ANIM_SWITCH_GALLERY_MS, ANIM_TOGGLE_ZOOM_MS, RAPID_NAV_SKIP_THRESHOLD,
     ANIM_OPEN_MS, ANIM_ZOOM_MS,
     FIT_DEFAULT_SCALE, FIT_OPEN_SCALE, OPEN_ALPHA_START,
@@ -43,7 +43,7 @@ from imagura.config import (
     KEY_TOGGLE_WINDOW,
     MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT, NAV_EDGE_MIN_PX, GALLERY_MIN_HEIGHT_PX,
 )
-from imagura.math_utils import clamp, lerp, ease_out_quad, ease_in_out_cubic
+from imagura.math_utils import approach, clamp, lerp, ease_out_quad, ease_in_out_cubic
 from imagura.rl_compat import (
     rl, RL_VERSION, RL_WHITE,
     make_rect as RL_Rect, make_vec2 as RL_V2, make_color as RL_Color,
@@ -56,7 +56,8 @@ from imagura.win_utils import (
 )
 from imagura.image_utils import list_supported_files
 from imagura.image_sorting import resort_preserving_current, sort_image_paths
-from imagura.logging import log, now, increment_frame, get_frame
+from imagura.i18n import load_persisted_language, tr
+from imagura.logging import log, now, increment_frame, get_frame, get_logger
 from imagura.types import (
     ViewParams, TextureInfo,
 )
@@ -67,6 +68,7 @@ from imagura.view_math import (
     clamp_pan as clamp_pan_pure,
     view_for_1to1_centered as view_1to1_pure,
     sanitize_view as sanitize_view_pure,
+    lerp_view,
 )
 from imagura.gallery import GalleryBehavior, GalleryRenderer
 from imagura.image_loading import CurrentAndNeighborLoader, load_content_cpu
@@ -80,6 +82,7 @@ from imagura.services import (
     TextureManager,
     ThumbnailService,
 )
+from imagura.services.textures import DEFERRED_UNLOAD_FRAMES
 from imagura.state import AppState
 from imagura.state.ui import ToolbarButtonId, MenuItemId
 from imagura.clipboard import copy_image_to_clipboard
@@ -162,6 +165,10 @@ def _fullscreen_window_flags() -> int:
 # It uses composition of sub-states while providing backward-compatible properties.
 
 
+# Font character set: ASCII 32-126 + Cyrillic 0x400-0x4FF (1024-1279)
+_FONT_CODEPOINTS = tuple(range(32, 127)) + tuple(range(0x400, 0x500))
+
+
 def load_unicode_font(font_size: int = None):
     """Load a Unicode font with Cyrillic support and optional antialiasing."""
     if font_size is None:
@@ -173,25 +180,26 @@ def load_unicode_font(font_size: int = None):
         "C:\\Windows\\Fonts\\tahoma.ttf",
     ]
 
-    # Build character set: ASCII + Cyrillic
-    # ASCII: 32-126, Cyrillic: 0x400-0x4FF (1024-1279)
-    codepoints = list(range(32, 127)) + list(range(0x400, 0x500))
+    # One C array for every candidate font; LoadFontEx copies what it needs.
+    count = len(_FONT_CODEPOINTS)
+    if hasattr(rl, 'ffi'):
+        cp_array = rl.ffi.new(f'int[{count}]', _FONT_CODEPOINTS)
+    else:
+        import ctypes
+        cp_array = (ctypes.c_int * count)(*_FONT_CODEPOINTS)
 
     for font_path in font_paths:
         if os.path.exists(font_path):
             try:
                 if hasattr(rl, 'ffi'):
                     # cffi version
-                    cp_array = rl.ffi.new(f'int[{len(codepoints)}]', codepoints)
-                    font = rl.LoadFontEx(font_path.encode('utf-8'), font_size, cp_array, len(codepoints))
+                    font = rl.LoadFontEx(font_path.encode('utf-8'), font_size, cp_array, count)
                 else:
                     # ctypes version
-                    import ctypes
-                    cp_array = (ctypes.c_int * len(codepoints))(*codepoints)
                     try:
-                        font = rl.LoadFontEx(font_path, font_size, cp_array, len(codepoints))
+                        font = rl.LoadFontEx(font_path, font_size, cp_array, count)
                     except TypeError:
-                        font = rl.LoadFontEx(font_path.encode('utf-8'), font_size, cp_array, len(codepoints))
+                        font = rl.LoadFontEx(font_path.encode('utf-8'), font_size, cp_array, count)
 
                 if hasattr(font, 'texture') and hasattr(font.texture, 'id') and font.texture.id > 0:
                     # Apply antialiasing (bilinear filtering) to font texture
@@ -379,7 +387,7 @@ def toggle_window_mode(state: AppState):
 
         state.hwnd = get_window_handle_from_raylib()
         set_titlebar_dark(state.hwnd)
-        win_set_blur(state.hwnd, True)
+        _invalidate_blur_state()
         log(f"[WINDOW] Windowed: {win_w}x{win_h} scale={new_scale:.3f} "
             f"fits={bool(ti) and fits}")
     else:
@@ -435,7 +443,7 @@ def toggle_window_mode(state: AppState):
 
         state.hwnd = get_window_handle_from_raylib()
         set_titlebar_dark(state.hwnd)
-        win_set_blur(state.hwnd, True)
+        _invalidate_blur_state()
         log(f"[WINDOW] Fullscreen: {work_w}x{work_h} scale={cur_scale:.3f}")
 
 
@@ -497,8 +505,8 @@ def drop_cached_path(state: AppState, path: str) -> None:
     _ANIMATED_CONTENT_CACHE.remove(path)
 
 
-def process_deferred_unloads(state: AppState):
-    _TEXTURE_MANAGER.process_deferred_unloads(state)
+def process_deferred_unloads(state: AppState, min_age: int = DEFERRED_UNLOAD_FRAMES):
+    _TEXTURE_MANAGER.process_deferred_unloads(state, min_age)
 
 
 def compute_fit_view(state, frac):
@@ -535,6 +543,17 @@ def win_set_blur(hwnd, enabled: bool):
 _current_blur_enabled: Optional[bool] = None
 
 
+def _invalidate_blur_state() -> None:
+    """Make apply_bg_mode re-apply the wanted blur state on the next frame."""
+    global _current_blur_enabled
+    _current_blur_enabled = None
+
+
+# Built once with the binding-agnostic constructor instead of trying rl.BLANK
+# and falling back inside the per-frame path.
+_BG_BLANK = RL_Color(0, 0, 0, 0)
+
+
 def apply_bg_mode(state: AppState):
     global _current_blur_enabled
 
@@ -547,38 +566,50 @@ def apply_bg_mode(state: AppState):
         _current_blur_enabled = blur_wanted
         log(f"[BG] Blur {'enabled' if blur_wanted else 'disabled'}")
 
-    c = mode["color"]
+    r, g, b = mode["color"]
     a = clamp(state.bg_current_opacity, 0.0, 1.0)
 
     if blur_wanted:
         # For blur mode: clear to transparent, then draw semi-opaque overlay
-        try:
-            rl.ClearBackground(rl.BLANK)
-        except Exception:
-            rl.ClearBackground(RL_Color(0, 0, 0, 0))
-        # Draw overlay only if opacity > 0
-        if a > 0.01:
-            rl.DrawRectangle(0, 0, state.screenW, state.screenH, RL_Color(c[0], c[1], c[2], int(255 * a)))
+        rl.ClearBackground(_BG_BLANK)
+        # Draw overlay only if it would be visible at 8-bit alpha
+        alpha = int(255 * a)
+        if alpha > 2:
+            rl.DrawRectangle(0, 0, state.screenW, state.screenH, RL_Color(r, g, b, alpha))
     else:
         # Solid background
-        col = RL_Color(c[0], c[1], c[2], 255)
-        rl.ClearBackground(col)
+        rl.ClearBackground(RL_Color(r, g, b, 255))
+
+
+# DrawTexturePro takes its structs by value, so the image pass fills one
+# scratch source/destination pair instead of allocating new ones per draw.
+_SRC_RECT = RL_Rect(0, 0, 0, 0)
+_DST_RECT = RL_Rect(0, 0, 0, 0)
+_ORIGIN = RL_V2(0, 0)
+_TINT_OPAQUE = RL_Color(255, 255, 255, 255)
 
 
 def render_image_at(ti: TextureInfo, v: ViewParams, alpha: float = 1.0):
     if not ti:
         return
+    # Below one 8-bit alpha step the draw is invisible (e.g. the outgoing
+    # image at the end of a switch slide); skip the DrawTexturePro.
+    if alpha < 1.0 / 255.0:
+        return
     tex_id = getattr(ti.tex, 'id', 0)
     if not tex_id or tex_id <= 0:
         return
-    tint = RL_Color(255, 255, 255, int(255 * alpha))
+    tint = _TINT_OPAQUE if alpha >= 1.0 else RL_Color(255, 255, 255, int(255 * alpha))
+    src = _SRC_RECT
+    src.width = ti.w
+    src.height = ti.h
     # Round destination coordinates to prevent subpixel rendering artifacts (1px line at edges)
-    dst_x = round(v.offx)
-    dst_y = round(v.offy)
-    dst_w = round(ti.w * v.scale)
-    dst_h = round(ti.h * v.scale)
-    rl.DrawTexturePro(ti.tex, RL_Rect(0, 0, ti.w, ti.h), RL_Rect(dst_x, dst_y, dst_w, dst_h),
-                      RL_V2(0, 0), 0.0, tint)
+    dst = _DST_RECT
+    dst.x = round(v.offx)
+    dst.y = round(v.offy)
+    dst.width = round(ti.w * v.scale)
+    dst.height = round(ti.h * v.scale)
+    rl.DrawTexturePro(ti.tex, src, dst, _ORIGIN, 0.0, tint)
 
 
 def draw_loading_indicator(state: AppState):
@@ -597,7 +628,6 @@ def draw_loading_indicator(state: AppState):
 
     rl.DrawRing(RL_V2(cx, cy), radius - thickness, radius, angle, angle + 90, 32, RL_Color(255, 255, 255, 220))
 
-    from imagura.i18n import tr
     text = tr("misc.loading")
     font_size = 28
     try:
@@ -608,6 +638,12 @@ def draw_loading_indicator(state: AppState):
     RL_DrawText(text, cx - text_width // 2, cy + radius + 30, font_size, RL_Color(255, 255, 255, 220))
 
 
+# Per-frame views for the open/switch animations. They are filled in place
+# and only read by render_image_at, which must not keep a reference.
+_SCRATCH_VIEW = ViewParams()
+_SCRATCH_PREV_VIEW = ViewParams()
+
+
 def render_image(state: AppState):
     ti = state.cache.curr
     if not ti:
@@ -634,11 +670,7 @@ def render_image(state: AppState):
         t_eased = ease_out_quad(t)
         from_view = state.anim.open_from_view
         to_view = state.last_fit_view
-        v = ViewParams(
-            scale=lerp(from_view.scale, to_view.scale, t_eased),
-            offx=lerp(from_view.offx, to_view.offx, t_eased),
-            offy=lerp(from_view.offy, to_view.offy, t_eased),
-        )
+        v = lerp_view(from_view, to_view, t_eased, out=_SCRATCH_VIEW)
         alpha = lerp(OPEN_ALPHA_START, 1.0, t_eased)
         state.bg_current_opacity = lerp(0.0, state.bg_target_opacity, t_eased)
         render_image_at(ti, v, alpha=alpha)
@@ -666,14 +698,16 @@ def render_image(state: AppState):
         prev_x = lerp(0, -offset, t_eased)
         curr_x = lerp(offset, 0, t_eased)
 
-        pv = ViewParams(
-            scale=state.switch_anim_prev_view.scale,
-            offx=state.switch_anim_prev_view.offx + prev_x,
-            offy=state.switch_anim_prev_view.offy
-        )
+        pv = _SCRATCH_PREV_VIEW
+        pv.scale = state.switch_anim_prev_view.scale
+        pv.offx = state.switch_anim_prev_view.offx + prev_x
+        pv.offy = state.switch_anim_prev_view.offy
         render_image_at(state.switch_anim_prev_tex, pv, alpha=1.0 - t_eased)
 
-        cv = ViewParams(scale=state.view.scale, offx=state.view.offx + curr_x, offy=state.view.offy)
+        cv = _SCRATCH_VIEW
+        cv.scale = state.view.scale
+        cv.offx = state.view.offx + curr_x
+        cv.offy = state.view.offy
         render_image_at(ti, cv, alpha=t_eased)
         return
 
@@ -691,8 +725,97 @@ def is_point_in_close_button(state: AppState, x: float, y: float) -> bool:
     cx, cy = get_close_button_pos(state)
     dx = x - cx
     dy = y - cy
-    dist = math.sqrt(dx * dx + dy * dy)
-    return dist <= CLOSE_BTN_RADIUS
+    return dx * dx + dy * dy <= CLOSE_BTN_RADIUS * CLOSE_BTN_RADIUS
+
+
+def _proximity_alpha(dist_sq: float, radius: float, far_alpha: float, hover_alpha: float) -> float:
+    """Target alpha for a round button given the squared mouse distance.
+
+    Hidden beyond 3R, hover alpha within R, max alpha within 1.5R, and a
+    linear ramp in between. Only the ramp band needs the real distance.
+    """
+    trigger_radius = radius * 3
+    if dist_sq > trigger_radius * trigger_radius:
+        return far_alpha
+    if dist_sq <= radius * radius:
+        return hover_alpha
+    inner = radius * 1.5
+    if dist_sq <= inner * inner:
+        return CLOSE_BTN_ALPHA_MAX
+    t = (trigger_radius - math.sqrt(dist_sq)) / (trigger_radius - inner)
+    return lerp(CLOSE_BTN_ALPHA_FAR, CLOSE_BTN_ALPHA_MAX, t)
+
+
+# Edge-triggered keys the main loop reacts to; polled once per frame.
+_FRAME_KEYS = (
+    KEY_TOGGLE_HUD, KEY_TOGGLE_FILENAME, KEY_CYCLE_BG, KEY_DELETE_IMAGE,
+    KEY_TOGGLE_ZOOM, KEY_TOGGLE_WINDOW, KEY_CLOSE,
+)
+
+
+def poll_frame_input(state: AppState):
+    """Read this frame's input once; the update and draw stages only read state.input.
+
+    Returns the raw mouse vector for callers that pass it on to UI handlers.
+    """
+    mouse = rl.GetMousePosition()
+    inp = state.input
+    inp.mouse_x = mouse.x
+    inp.mouse_y = mouse.y
+    inp.left_pressed = rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT)
+    inp.wheel = rl.GetMouseWheelMove()
+    inp.keys_pressed = frozenset(k for k in _FRAME_KEYS if rl.IsKeyPressed(k))
+    inp.zoom_in_held = rl.IsKeyDown(KEY_ZOOM_IN) or rl.IsKeyDown(KEY_ZOOM_IN_ALT)
+    inp.zoom_out_held = rl.IsKeyDown(KEY_ZOOM_OUT) or rl.IsKeyDown(KEY_ZOOM_OUT_ALT)
+    inp.next_held = rl.IsKeyDown(KEY_NEXT_IMAGE) or rl.IsKeyDown(KEY_NEXT_IMAGE_ALT)
+    inp.prev_held = rl.IsKeyDown(KEY_PREV_IMAGE) or rl.IsKeyDown(KEY_PREV_IMAGE_ALT)
+    delta = rl.GetMouseDelta()
+    inp.any_input = bool(
+        delta.x != 0 or delta.y != 0 or inp.wheel != 0 or inp.left_pressed
+        or rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_RIGHT)
+        or rl.GetKeyPressed() != 0 or inp.keys_pressed
+    )
+    return mouse
+
+
+# Frame skipping needs manual event polling; bindings without it always draw.
+_CAN_SKIP_FRAMES = hasattr(rl, "PollInputEvents") and hasattr(rl, "WaitTime")
+
+# raylib's frame clock only advances in BeginDrawing/EndDrawing, so the idle
+# wait of skipped frames lands in GetFrameTime of the next drawn frames. Cap
+# the step for this many frames after a skip so fades and slides still animate.
+_RESUME_CLAMP_FRAMES = 2
+
+
+def note_skipped_frame(state: AppState) -> None:
+    state.anim.dt_clamp_frames = _RESUME_CLAMP_FRAMES
+
+
+def update_frame_dt(state: AppState, raw_dt: float) -> float:
+    """Set the frame step used by dt-driven animation, clamped after idle skips."""
+    anim = state.anim
+    if anim.dt_clamp_frames > 0:
+        anim.dt_clamp_frames -= 1
+        raw_dt = min(raw_dt, 1.0 / TARGET_FPS)
+    anim.frame_dt = raw_dt
+    return raw_dt
+
+
+def frame_is_busy(state: AppState) -> bool:
+    """True while something on screen can change without further input."""
+    playback = state.playback
+    return (
+        state.open_anim_active or state.switch_anim_active
+        or state.zoom_anim_active or state.toggle_zoom_active
+        or len(state.switch_queue) > 0 or state.is_panning
+        or state.loading_current or state.transforming or state.waiting_for_switch
+        or len(state.thumb_queue) > 0
+        or (playback is not None and playback.playing)
+        or state.ui.scale_overlay_alpha > 0.0
+        or abs(state.bg_target_opacity - state.bg_current_opacity) >= 0.001
+        or state.ui.settings.visible
+        or _post_toggle_settle["active"]
+    )
 
 
 def update_close_button_alpha(state: AppState):
@@ -701,26 +824,15 @@ def update_close_button_alpha(state: AppState):
         state.close_btn_alpha = 0.0
         return
 
-    mouse = rl.GetMousePosition()
     cx, cy = get_close_button_pos(state)
 
-    dx = mouse.x - cx
-    dy = mouse.y - cy
-    dist = math.sqrt(dx * dx + dy * dy)
-
-    trigger_radius = CLOSE_BTN_RADIUS * 3
-
-    if dist > trigger_radius:
-        target_alpha = CLOSE_BTN_ALPHA_MIN
-    elif dist <= CLOSE_BTN_RADIUS:
-        target_alpha = CLOSE_BTN_ALPHA_HOVER
-    elif dist <= CLOSE_BTN_RADIUS * 1.5:
-        target_alpha = CLOSE_BTN_ALPHA_MAX
-    else:
-        t = (trigger_radius - dist) / (trigger_radius - CLOSE_BTN_RADIUS * 1.5)
-        target_alpha = lerp(CLOSE_BTN_ALPHA_FAR, CLOSE_BTN_ALPHA_MAX, t)
+    dx = state.input.mouse_x - cx
+    dy = state.input.mouse_y - cy
+    target_alpha = _proximity_alpha(
+        dx * dx + dy * dy, CLOSE_BTN_RADIUS, CLOSE_BTN_ALPHA_MIN, CLOSE_BTN_ALPHA_HOVER
+    )
 
-    dt = rl.GetFrameTime()
+    dt = state.anim.frame_dt
     fade_speed = min(1.0, 18.0 * dt)
     diff = target_alpha - state.close_btn_alpha
     state.close_btn_alpha += diff * fade_speed
@@ -762,10 +874,9 @@ def check_close_button_click(state: AppState) -> bool:
     if state.windowed_mode:
         return False
 
-    if not rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT):
+    if not state.input.left_pressed:
         return False
-    mouse = rl.GetMousePosition()
-    return is_point_in_close_button(state, mouse.x, mouse.y)
+    return is_point_in_close_button(state, state.input.mouse_x, state.input.mouse_y)
 
 
 def trigger_scale_overlay(state: AppState, mode=""):
@@ -775,7 +886,7 @@ def trigger_scale_overlay(state: AppState, mode=""):
 
 def update_scale_overlay(state: AppState):
     """Fade out scale overlay after 1s delay."""
-    _SCALE_OVERLAY.update(state, rl.GetFrameTime())
+    _SCALE_OVERLAY.update(state, state.anim.frame_dt)
 
 
 def draw_arrow_left(cx: int, cy: int, size: float, color):
@@ -799,8 +910,8 @@ def draw_arrow_right(cx: int, cy: int, size: float, color):
 
 
 def update_nav_buttons_fade(state: AppState):
-    mouse = rl.GetMousePosition()
-    dt = rl.GetFrameTime()
+    mouse_x, mouse_y = state.input.mouse_x, state.input.mouse_y
+    dt = state.anim.frame_dt
     zoom_threshold = state.last_fit_view.scale * 1.1
     is_significantly_zoomed = state.view.scale > zoom_threshold
 
@@ -814,42 +925,21 @@ def update_nav_buttons_fade(state: AppState):
     cy = state.screenH // 2
     cx_left = 60
     cx_right = state.screenW - 60
-    trigger_radius = NAV_BTN_RADIUS * 3
-
-    if state.index > 0:
-        dx = mouse.x - cx_left
-        dy = mouse.y - cy
-        dist = math.sqrt(dx * dx + dy * dy)
-
-        if dist > trigger_radius:
-            target_alpha = 0.0
-        elif dist <= NAV_BTN_RADIUS:
-            target_alpha = 1.0
-        elif dist <= NAV_BTN_RADIUS * 1.5:
-            target_alpha = CLOSE_BTN_ALPHA_MAX
-        else:
-            t = (trigger_radius - dist) / (trigger_radius - NAV_BTN_RADIUS * 1.5)
-            target_alpha = lerp(CLOSE_BTN_ALPHA_FAR, CLOSE_BTN_ALPHA_MAX, t)
+
+    if state.images.has_prev:
+        dx = mouse_x - cx_left
+        dy = mouse_y - cy
+        target_alpha = _proximity_alpha(dx * dx + dy * dy, NAV_BTN_RADIUS, 0.0, 1.0)
 
         diff = target_alpha - state.nav_left_alpha
         state.nav_left_alpha += diff * fade_speed
     else:
         state.nav_left_alpha = max(0.0, state.nav_left_alpha - fade_speed)
 
-    if state.index < len(state.current_dir_images) - 1:
-        dx = mouse.x - cx_right
-        dy = mouse.y - cy
-        dist = math.sqrt(dx * dx + dy * dy)
-
-        if dist > trigger_radius:
-            target_alpha = 0.0
-        elif dist <= NAV_BTN_RADIUS:
-            target_alpha = 1.0
-        elif dist <= NAV_BTN_RADIUS * 1.5:
-            target_alpha = CLOSE_BTN_ALPHA_MAX
-        else:
-            t = (trigger_radius - dist) / (trigger_radius - NAV_BTN_RADIUS * 1.5)
-            target_alpha = lerp(CLOSE_BTN_ALPHA_FAR, CLOSE_BTN_ALPHA_MAX, t)
+    if state.images.has_next:
+        dx = mouse_x - cx_right
+        dy = mouse_y - cy
+        target_alpha = _proximity_alpha(dx * dx + dy * dy, NAV_BTN_RADIUS, 0.0, 1.0)
 
         diff = target_alpha - state.nav_right_alpha
         state.nav_right_alpha += diff * fade_speed
@@ -863,7 +953,7 @@ def draw_nav_buttons(state: AppState):
 
     cy = state.screenH // 2
 
-    if state.nav_left_alpha > 0.01 and state.index > 0:
+    if state.nav_left_alpha > 0.01 and state.images.has_prev:
         cx = 60
         alpha = int(state.nav_left_alpha * 255)
         bg_alpha = int(state.nav_left_alpha * NAV_BTN_BG_ALPHA_MAX * 255)
@@ -872,14 +962,13 @@ def draw_nav_buttons(state: AppState):
         rl.DrawCircleLines(cx, cy, NAV_BTN_RADIUS, RL_Color(255, 255, 255, alpha))
         draw_arrow_left(cx, cy, 18, RL_Color(255, 255, 255, alpha))
 
-        mouse = rl.GetMousePosition()
-        dx = mouse.x - cx
-        dy = mouse.y - cy
+        dx = state.input.mouse_x - cx
+        dy = state.input.mouse_y - cy
         if dx * dx + dy * dy <= NAV_BTN_RADIUS * NAV_BTN_RADIUS:
-            if rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT):
+            if state.input.left_pressed:
                 switch_to(state, state.index - 1, animate=True, anim_duration_ms=ANIM_SWITCH_KEYS_MS)
 
-    if state.nav_right_alpha > 0.01 and state.index < len(state.current_dir_images) - 1:
+    if state.nav_right_alpha > 0.01 and state.images.has_next:
         cx = state.screenW - 60
         alpha = int(state.nav_right_alpha * 255)
         bg_alpha = int(state.nav_right_alpha * NAV_BTN_BG_ALPHA_MAX * 255)
@@ -888,11 +977,10 @@ def draw_nav_buttons(state: AppState):
         rl.DrawCircleLines(cx, cy, NAV_BTN_RADIUS, RL_Color(255, 255, 255, alpha))
         draw_arrow_right(cx, cy, 18, RL_Color(255, 255, 255, alpha))
 
-        mouse = rl.GetMousePosition()
-        dx = mouse.x - cx
-        dy = mouse.y - cy
+        dx = state.input.mouse_x - cx
+        dy = state.input.mouse_y - cy
         if dx * dx + dy * dy <= NAV_BTN_RADIUS * NAV_BTN_RADIUS:
-            if rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT):
+            if state.input.left_pressed:
                 switch_to(state, state.index + 1, animate=True, anim_duration_ms=ANIM_SWITCH_KEYS_MS)
 
 
@@ -923,8 +1011,7 @@ def apply_runtime_config_change(config_key: str, state: Optional[AppState]) -> N
         )
     elif config_key == "BLUR_ENABLED":
         # Force apply_bg_mode to re-evaluate blur on the next frame.
-        global _current_blur_enabled
-        _current_blur_enabled = None
+        _invalidate_blur_state()
 
 
 def _mirror_config_global(config_key: str) -> None:
@@ -979,12 +1066,7 @@ def delete_current_image(state: AppState) -> bool:
 
     # Unload all cached textures (curr, prev, next) since indices shift
     for ti in (state.cache.curr, state.cache.prev, state.cache.next):
-        if ti:
-            try:
-                if getattr(ti.tex, 'id', 0):
-                    state.to_unload.append(ti.tex)
-            except Exception:
-                pass
+        _TEXTURE_MANAGER.defer_unload(state, ti)
     state.cache.curr = None
     state.cache.prev = None
     state.cache.next = None
@@ -1037,11 +1119,7 @@ def reload_current_image(state: AppState):
 
     # Unload current texture
     if state.cache.curr:
-        try:
-            if getattr(state.cache.curr.tex, 'id', 0):
-                state.to_unload.append(state.cache.curr.tex)
-        except Exception:
-            pass
+        _TEXTURE_MANAGER.defer_unload(state, state.cache.curr)
         state.cache.curr = None
 
     # Also invalidate thumbnail
@@ -1054,8 +1132,7 @@ def reload_current_image(state: AppState):
                 pass
 
     # Schedule thumbnail reload
-    if path not in state.thumb_queue:
-        state.thumb_queue.append(path)
+    state.thumb_queue.append(path)
 
     # Reload
     preload_neighbors(state, state.index, skip_neighbors=True)
@@ -1079,8 +1156,7 @@ def invalidate_cached_path(state: AppState, path: str) -> None:
             except Exception:
                 pass
 
-    if path not in state.thumb_queue:
-        state.thumb_queue.append(path)
+    state.thumb_queue.append(path)
 
 
 def run_transform_async(state: AppState, transform_func, path: str, **kwargs):
@@ -1127,7 +1203,7 @@ def process_thumb_queue(state: AppState):
 
 
 def update_gallery_scroll(state: AppState):
-    _GALLERY_BEHAVIOR.update_scroll(state, rl.GetFrameTime())
+    _GALLERY_BEHAVIOR.update_scroll(state, state.anim.frame_dt)
 
 
 def reconcile_gallery_target(state: AppState):
@@ -1139,33 +1215,35 @@ def reconcile_gallery_target(state: AppState):
 
 
 def update_gallery_visibility_and_slide(state: AppState):
-    mouse = rl.GetMousePosition()
     _GALLERY_BEHAVIOR.update_visibility_and_slide(
         state,
-        mouse.y,
-        rl.GetFrameTime(),
+        state.input.mouse_y,
+        state.anim.frame_dt,
         get_gallery_height(state.screenH),
         force_visible=state.gallery.sort_menu_open,
     )
 
 
 def is_mouse_over_gallery(state: AppState) -> bool:
-    mouse = rl.GetMousePosition()
-    return _GALLERY_BEHAVIOR.is_mouse_over(state, mouse.y, get_gallery_height(state.screenH))
+    return _GALLERY_BEHAVIOR.is_mouse_over(state, state.input.mouse_y, get_gallery_height(state.screenH))
 
 
 def render_gallery(state: AppState):
-    mouse = rl.GetMousePosition()
-    left_clicked = rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT)
+    # Fully slid out (the usual case while viewing): nothing to hit-test or draw.
+    # An open sort menu forces the strip visible, so it never lands here open.
+    if state.gallery_y >= state.screenH and not state.gallery.sort_menu_open:
+        return None
+    mouse_x, mouse_y = state.input.mouse_x, state.input.mouse_y
+    left_clicked = state.input.left_pressed
     gallery_height = get_gallery_height(state.screenH)
-    sort_result = handle_gallery_sort_input(state, mouse.x, mouse.y, left_clicked, gallery_height)
+    sort_result = handle_gallery_sort_input(state, mouse_x, mouse_y, left_clicked, gallery_height)
     if sort_result.changed:
         apply_gallery_sort(state)
 
     clicked_index = _GALLERY_RENDERER.render(
         state,
-        mouse.x,
-        mouse.y,
+        mouse_x,
+        mouse_y,
         left_clicked and not sort_result.consumed_click,
         gallery_height,
     )
@@ -1260,7 +1338,6 @@ def _draw_no_images_button(rect: tuple[int, int, int, int], label: str, hovered:
 
 
 def draw_no_images_screen(state: AppState, dirpath: str, mouse_x: float, mouse_y: float) -> None:
-    from imagura.i18n import tr
     title = tr("empty.no_images")
     path_text = dirpath
     if len(path_text) > 96:
@@ -1293,6 +1370,8 @@ def run_no_images_screen(state: AppState, dirpath: str) -> Optional[str]:
     window should close.
     """
     while not rl.WindowShouldClose():
+        mouse = poll_frame_input(state)
+        update_frame_dt(state, rl.GetFrameTime())
         update_close_button_alpha(state)
         update_toolbar_alpha_ui(state)
 
@@ -1300,9 +1379,8 @@ def run_no_images_screen(state: AppState, dirpath: str) -> Optional[str]:
         if settings_active:
             handle_settings_input(state)
 
-        mouse = rl.GetMousePosition()
         open_rect, exit_rect = _no_images_button_rects(state)
-        left_clicked = rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT)
+        left_clicked = state.input.left_pressed
 
         toolbar_clicked_button = update_toolbar_input(state, mouse, settings_active)
         toolbar_consumed_click = toolbar_clicked_button is not None
@@ -1313,7 +1391,7 @@ def run_no_images_screen(state: AppState, dirpath: str) -> Optional[str]:
                 log(f"[TOOLBAR] Ignored without current image: {toolbar_clicked_button.tooltip}")
 
         if not settings_active:
-            if rl.IsKeyPressed(KEY_CLOSE):
+            if KEY_CLOSE in state.input.keys_pressed:
                 return None
             if not toolbar_consumed_click and check_close_button_click(state):
                 return None
@@ -1462,24 +1540,15 @@ def update_toggle_zoom_animation(state: AppState):
 def apply_bg_opacity_anim(state: AppState):
     if state.open_anim_active:
         return
-    delta = state.bg_target_opacity - state.bg_current_opacity
-    if abs(delta) < 0.001:
+    target = state.bg_target_opacity
+    if abs(target - state.bg_current_opacity) < 0.001:
         return
     step = (1.0 / (ANIM_SWITCH_KEYS_MS / 1000.0)) / TARGET_FPS
-    state.bg_current_opacity += clamp(delta, -step, step)
+    state.bg_current_opacity = approach(state.bg_current_opacity, target, step)
 
 
 def detect_double_click(state: AppState, x: int, y: int) -> bool:
-    t = now()
-    if (t - state.last_click_time) < (DOUBLE_CLICK_TIME_MS / 1000.0):
-        dx = abs(x - state.last_click_pos[0])
-        dy = abs(y - state.last_click_pos[1])
-        if dx < 10 and dy < 10:
-            state.last_click_time = 0.0
-            return True
-    state.last_click_time = t
-    state.last_click_pos = (x, y)
-    return False
+    return state.input.check_double_click(x, y)
 
 
 class AppController:
@@ -1488,6 +1557,7 @@ class AppController:
         self.font_loaded = False
         self.blur_enabled = False
         self.first_render_done = False
+        self.redraw_until = 0.0
 
     def setup(self, start_path) -> bool:
         state = self.state
@@ -1550,12 +1620,11 @@ class AppController:
 
         return True
 
-    def _poll_async(self):
+    def _poll_async(self) -> int:
         state = self.state
         if state.open_anim_active:
-            state.async_loader.poll_ui_events(max_events=2)
-        else:
-            state.async_loader.poll_ui_events(max_events=100)
+            return state.async_loader.poll_ui_events(max_events=2)
+        return state.async_loader.poll_ui_events(max_events=100, time_budget_s=UI_EVENT_BUDGET_MS / 1000.0)
 
     def _update(self):
         state = self.state
@@ -1574,11 +1643,12 @@ class AppController:
             log(f"[MAIN] Set FIT_OPEN view for animation")
 
         process_deferred_unloads(state)
+        update_frame_dt(state, rl.GetFrameTime())
 
         # Advance animated content playback
         _ANIMATED_PLAYBACK.advance(
             state,
-            rl.GetFrameTime() * 1000.0,
+            state.anim.frame_dt * 1000.0,
             lambda old_ti: unload_texture_deferred(state, old_ti),
         )
 
@@ -1600,6 +1670,10 @@ class AppController:
     def run(self):
         state = self.state
 
+        # The frame counter lives on the logger (it prefixes every log line);
+        # bind the bound method once instead of resolving it every frame.
+        tick_frame = get_logger().increment_frame
+
         # Key repeat state for navigation
         nav_key_state = {
             'next': {'pressed_time': 0.0, 'last_repeat': 0.0},
@@ -1608,11 +1682,16 @@ class AppController:
 
         try:
             while True:
-                self._poll_async()
+                # Stage 1: read input. Everything below uses these samples.
+                mouse = poll_frame_input(state)
+                inp = state.input
+                keys_pressed = inp.keys_pressed
+                wheel = inp.wheel
+                # Stage 2: async results and animation/state updates.
+                ui_events = self._poll_async()
                 self._update()
 
-                should_close = rl.WindowShouldClose()
-                if should_close:
+                if rl.WindowShouldClose():
                     break
 
                 # Handle window resize in windowed mode
@@ -1621,6 +1700,7 @@ class AppController:
                     new_w = rl.GetScreenWidth()
                     new_h = rl.GetScreenHeight()
                     if new_w != state.screenW or new_h != state.screenH:
+                        ui_events += 1
                         state.screenW = new_w
                         state.screenH = new_h
                         # Keep the current zoom on resize (don't snap to fit);
@@ -1635,11 +1715,28 @@ class AppController:
                 if settings_active:
                     handle_settings_input(state)
 
+                # Only mark activity on actual user input (mouse move, key/button press, wheel)
+                if inp.any_input:
+                    state.idle_detector.mark_activity()
+                    ui_events += 1
+
+                # Skip drawing a static frame: nothing animating, no input and
+                # no UI events for a while. Held keys repeat without key-press
+                # events, so they keep the frame live too.
+                t_frame = now()
+                if (ui_events or frame_is_busy(state) or not self.first_render_done
+                        or inp.next_held or inp.prev_held or inp.zoom_in_held or inp.zoom_out_held):
+                    self.redraw_until = t_frame + REDRAW_SETTLE_SECONDS
+                elif _CAN_SKIP_FRAMES and t_frame >= self.redraw_until:
+                    note_skipped_frame(state)
+                    rl.PollInputEvents()
+                    rl.WaitTime(1.0 / TARGET_FPS)
+                    continue
+
+                # Stage 3: UI input handling and drawing.
                 rl.BeginDrawing()
                 apply_bg_mode(state)
 
-                mouse = rl.GetMousePosition()
-
                 # ─── Context Menu Input ─────────────────────────────────────────────
                 context_menu_result = handle_context_menu_input(state, mouse, settings_active)
                 menu_consumed_click = context_menu_result.consumed_click
@@ -1674,63 +1771,46 @@ class AppController:
                 if not input_consumed and check_close_button_click(state):
                     break
 
-                # Only mark activity on actual user input (mouse move, key/button press, wheel)
-                _mouse_delta = rl.GetMouseDelta()
-                if (_mouse_delta.x != 0 or _mouse_delta.y != 0
-                        or rl.GetMouseWheelMove() != 0
-                        or rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT)
-                        or rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_RIGHT)
-                        or rl.GetKeyPressed() != 0):
-                    state.idle_detector.mark_activity()
-
                 # Block all keyboard input when settings menu is open
                 if not settings_active:
-                    if rl.IsKeyPressed(KEY_TOGGLE_HUD):
+                    if KEY_TOGGLE_HUD in keys_pressed:
                         state.show_hud = not state.show_hud
 
-                    if rl.IsKeyPressed(KEY_TOGGLE_FILENAME):
+                    if KEY_TOGGLE_FILENAME in keys_pressed:
                         state.show_filename = not state.show_filename
 
-                    if rl.IsKeyPressed(KEY_CYCLE_BG):
+                    if KEY_CYCLE_BG in keys_pressed:
                         state.bg_mode_index = (state.bg_mode_index + 1) % len(BG_MODES)
                         state.bg_target_opacity = BG_MODES[state.bg_mode_index]["opacity"]
 
                 # DEL key - delete image to recycle bin (NEVER when settings active)
-                if rl.IsKeyPressed(KEY_DELETE_IMAGE) and not state.open_anim_active and not settings_active:
+                if KEY_DELETE_IMAGE in keys_pressed and not state.open_anim_active and not settings_active:
                     if delete_current_image(state):
                         if len(state.current_dir_images) == 0:
                             # No more images - close app
                             break
                         rl.EndDrawing()
-                        increment_frame()
+                        tick_frame()
                         continue
 
-                if state.cache.curr and not state.open_anim_active and not state.toggle_zoom_active and not settings_active:
-                    if rl.IsKeyDown(KEY_ZOOM_IN) or rl.IsKeyDown(KEY_ZOOM_IN_ALT):
-                        apply_manual_zoom(
-                            state,
-                            1.0 + ZOOM_STEP_KEYS,
-                            (int(mouse.x), int(mouse.y)),
-                            MAX_ZOOM,
-                            start_zoom_animation,
-                            trigger_scale_overlay,
-                            save_view_for_path,
-                        )
-
-                    if rl.IsKeyDown(KEY_ZOOM_OUT) or rl.IsKeyDown(KEY_ZOOM_OUT_ALT):
-                        apply_manual_zoom(
-                            state,
-                            1.0 - ZOOM_STEP_KEYS,
-                            (int(mouse.x), int(mouse.y)),
-                            MAX_ZOOM,
-                            start_zoom_animation,
-                            trigger_scale_overlay,
-                            save_view_for_path,
-                        )
-
-                wheel = rl.GetMouseWheelMove()
+                # Key and wheel zoom are folded into one multiplier and applied
+                # once, so a frame with several zoom inputs does a single
+                # anchor/clamp pass instead of each overriding the last.
+                pending_scale = 1.0
+                # Zoom/pan input is ignored while an open or toggle-zoom animation
+                # owns the view. Re-evaluated before panning: the toggle-zoom key
+                # below can start an animation mid-frame.
+                view_input_open = bool(state.cache.curr) and not (
+                    state.open_anim_active or state.toggle_zoom_active or settings_active)
+                if view_input_open:
+                    if inp.zoom_in_held:
+                        pending_scale *= 1.0 + ZOOM_STEP_KEYS
+
+                    if inp.zoom_out_held:
+                        pending_scale *= 1.0 - ZOOM_STEP_KEYS
+
                 # Mouse wheel zoom - blocked when settings menu is open (settings has its own scroll)
-                if wheel != 0.0 and state.cache.curr and not state.open_anim_active and not state.toggle_zoom_active and not settings_active:
+                if wheel != 0.0 and view_input_open:
                     if is_mouse_over_gallery(state):
                         n = len(state.current_dir_images)
                         base = state.gallery_target_index if state.gallery_target_index is not None else state.index
@@ -1741,45 +1821,51 @@ class AppController:
                         state.gallery_target_index = target
                         state.gallery_last_wheel_time = now()
                     else:
-                        apply_manual_zoom(
-                            state,
-                            1.0 + wheel * ZOOM_STEP_WHEEL,
-                            (int(mouse.x), int(mouse.y)),
-                            MAX_ZOOM,
-                            start_zoom_animation,
-                            trigger_scale_overlay,
-                            save_view_for_path,
-                        )
+                        pending_scale *= 1.0 + wheel * ZOOM_STEP_WHEEL
+
+                if pending_scale != 1.0:
+                    apply_manual_zoom(
+                        state,
+                        pending_scale,
+                        (int(mouse.x), int(mouse.y)),
+                        MAX_ZOOM,
+                        start_zoom_animation,
+                        trigger_scale_overlay,
+                        save_view_for_path,
+                    )
 
                 # Double-click zone: everywhere except navigation edges
-                # Use adaptive edge zones: at least NAV_EDGE_MIN_PX or 10% of screen
+                # Use adaptive edge zones: at least NAV_EDGE_MIN_PX or 10% of screen.
+                # Computed once per frame; the navigation block below reuses them.
                 edge_zone = max(state.screenW * 0.10, NAV_EDGE_MIN_PX)
-                not_on_edge = (mouse.x > edge_zone and
-                              mouse.x < state.screenW - edge_zone)
+                edge_left = mouse.x <= edge_zone
+                edge_right = mouse.x >= state.screenW - edge_zone
+                not_on_edge = not (edge_left or edge_right)
 
                 if not settings_active:
-                    if rl.IsKeyPressed(KEY_TOGGLE_ZOOM) and not state.toggle_zoom_active:
+                    if KEY_TOGGLE_ZOOM in keys_pressed and not state.toggle_zoom_active:
                         start_toggle_zoom_animation(state)
 
                     # Toggle window mode (F key)
-                    if rl.IsKeyPressed(KEY_TOGGLE_WINDOW):
+                    if KEY_TOGGLE_WINDOW in keys_pressed:
                         toggle_window_mode(state)
 
                 # Always track clicks for double-click detection, even during animation
-                if not_on_edge and rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT) and not input_consumed:
+                if not_on_edge and state.input.left_pressed and not input_consumed:
                     is_double = detect_double_click(state, int(mouse.x), int(mouse.y))
                     if is_double and not state.toggle_zoom_active:
                         start_toggle_zoom_animation(state)
 
-                if state.cache.curr and not state.open_anim_active and not state.toggle_zoom_active and not settings_active:
-                    img_rect = RL_Rect(state.view.offx, state.view.offy, state.cache.curr.w * state.view.scale,
-                                       state.cache.curr.h * state.view.scale)
-                    over_img = (
-                            img_rect.x <= mouse.x <= img_rect.x + img_rect.width and img_rect.y <= mouse.y <= img_rect.y + img_rect.height)
+                view_input_open = bool(state.cache.curr) and not (
+                    state.open_anim_active or state.toggle_zoom_active or settings_active)
+                if view_input_open:
+                    view = state.view
+                    ix, iy = view.offx, view.offy
+                    over_img = (ix <= mouse.x <= ix + state.cache.curr.w * view.scale
+                                and iy <= mouse.y <= iy + state.cache.curr.h * view.scale)
 
                     # Allow panning in any zoom mode (not just when zoomed)
-                    if rl.IsMouseButtonPressed(
-                            rl.MOUSE_BUTTON_LEFT) and over_img and not is_point_in_close_button(state,
+                    if state.input.left_pressed and over_img and not is_point_in_close_button(state,
                                                                                                 mouse.x,
                                                                                                 mouse.y) and not input_consumed:
                         state.is_panning = True
@@ -1802,23 +1888,19 @@ class AppController:
                                                                           state.view.offy)
 
                     if state.is_panning:
-                        dx = mouse.x - state.pan_start_mouse[0]
-                        dy = mouse.y - state.pan_start_mouse[1]
-                        nv = ViewParams(scale=state.view.scale, offx=state.pan_start_offset[0] + dx,
-                                        offy=state.pan_start_offset[1] + dy)
+                        # clamp_pan returns a copy, so the scratch view is safe to reuse
+                        nv = _SCRATCH_VIEW
+                        nv.scale = state.view.scale
+                        nv.offx = state.pan_start_offset[0] + mouse.x - state.pan_start_mouse[0]
+                        nv.offy = state.pan_start_offset[1] + mouse.y - state.pan_start_mouse[1]
                         state.view = clamp_pan(nv, state.cache.curr, state.screenW, state.screenH)
 
                 if not state.open_anim_active and not settings_active:
-                    # Use adaptive edge zones for navigation
-                    nav_edge = max(state.screenW * 0.10, NAV_EDGE_MIN_PX)
-                    edge_left = (mouse.x <= nav_edge)
-                    edge_right = (mouse.x >= state.screenW - nav_edge)
-
                     # Navigation with key repeat support
                     current_time = now()
 
                     # Next image (Right, D)
-                    next_down = rl.IsKeyDown(KEY_NEXT_IMAGE) or rl.IsKeyDown(KEY_NEXT_IMAGE_ALT)
+                    next_down = inp.next_held
                     if next_down:
                         should_trigger = False
                         if nav_key_state['next']['pressed_time'] == 0.0:
@@ -1838,7 +1920,7 @@ class AppController:
                         nav_key_state['next']['pressed_time'] = 0.0
 
                     # Previous image (Left, A)
-                    prev_down = rl.IsKeyDown(KEY_PREV_IMAGE) or rl.IsKeyDown(KEY_PREV_IMAGE_ALT)
+                    prev_down = inp.prev_held
                     if prev_down:
                         should_trigger = False
                         if nav_key_state['prev']['pressed_time'] == 0.0:
@@ -1866,10 +1948,10 @@ class AppController:
                     in_gallery_panel = gallery_is_visible and (yv <= mouse.y <= state.screenH)
 
                     if not is_significantly_zoomed and not in_gallery_panel and not input_consumed:
-                        if edge_right and rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT):
+                        if edge_right and state.input.left_pressed:
                             if state.index + 1 < len(state.current_dir_images):
                                 switch_to(state, state.index + 1, animate=True, anim_duration_ms=ANIM_SWITCH_KEYS_MS)
-                        if edge_left and rl.IsMouseButtonPressed(rl.MOUSE_BUTTON_LEFT):
+                        if edge_left and state.input.left_pressed:
                             if state.index - 1 >= 0:
                                 switch_to(state, state.index - 1, animate=True, anim_duration_ms=ANIM_SWITCH_KEYS_MS)
 
@@ -1912,15 +1994,13 @@ class AppController:
                 draw_settings_window(state)
 
                 rl.EndDrawing()
-                increment_frame()
+                tick_frame()
 
                 # Skip other key handling when settings is open
                 if state.ui.settings.visible:
                     continue
 
-                if rl.IsKeyPressed(KEY_CLOSE):
-                    break
-                if should_close:
+                if KEY_CLOSE in keys_pressed:
                     break
         except Exception as e:
             log(f"[MAIN][CRITICAL] Unhandled exception in main loop: {e!r}")
@@ -1938,14 +2018,9 @@ class AppController:
             log("[CLEANUP] Cleaning up playback")
             _ANIMATED_PLAYBACK.stop(state)
         log("[CLEANUP] Processing deferred unloads")
-        process_deferred_unloads(state)
+        process_deferred_unloads(state, min_age=0)
         log("[CLEANUP] Unloading thumbnails")
-        for bt in list(state.thumb_cache.values()):
-            try:
-                if bt.texture:
-                    rl.UnloadTexture(bt.texture)
-            except Exception:
-                pass
+        _unload_textures_batch([bt.texture for bt in state.thumb_cache.values() if bt.texture], "thumbnails")
         log("[CLEANUP] Unloading large texture cache")
         for ti in _LARGE_TEXTURE_CACHE.clear():
             if not _is_texture_active(state, ti):
@@ -1953,12 +2028,11 @@ class AppController:
         log("[CLEANUP] Clearing animated content cache")
         _ANIMATED_CONTENT_CACHE.clear()
         log("[CLEANUP] Unloading cached textures")
-        for ti in (state.cache.prev, state.cache.curr, state.cache.next):
-            try:
-                if ti and getattr(ti.tex, 'id', 0):
-                    rl.UnloadTexture(ti.tex)
-            except Exception:
-                pass
+        _unload_textures_batch(
+            [ti.tex for ti in (state.cache.prev, state.cache.curr, state.cache.next)
+             if ti and getattr(ti.tex, 'id', 0)],
+            "cached textures",
+        )
         try:
             log("[CLEANUP] Closing window")
             rl.CloseWindow()
@@ -1967,9 +2041,20 @@ class AppController:
         log("[CLEANUP] Cleanup complete")
 
 
+def _unload_textures_batch(textures, label: str) -> None:
+    """Unload textures at shutdown, logging one summary line instead of one per failure."""
+    failed = 0
+    for tex in textures:
+        try:
+            rl.UnloadTexture(tex)
+        except Exception:
+            failed += 1
+    if failed:
+        log(f"[CLEANUP][WARN] {failed}/{len(textures)} {label} failed to unload")
+
+
 def main():
     log("[MAIN] Starting application")
-    from imagura.i18n import load_persisted_language
     load_persisted_language()
     apply_saved_settings()
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import json
 import sys
+import threading
 import time
 import unittest
 from collections import OrderedDict, deque
@@ -18,21 +19,40 @@ from imagura.image_metadata.exif_cache import ExifMetadataCache
 from imagura.image_loading import CurrentAndNeighborLoader
 from imagura.image_sorting import resort_preserving_current, sort_image_paths
 from imagura.image_utils import list_supported_files
+from imagura.logging import get_frame, set_frame
+from imagura.math_utils import approach
 from imagura.playback import AnimatedContentPlayback
 from imagura.platform.file_deletion import delete_to_trash
 from imagura.platform.file_dialog import _open_image_file_dialog_pywin32, build_image_file_filter
 from imagura.services.animated_content_cache import AnimatedContentCache
 from imagura.services.large_texture_cache import LargeTextureCache
 from imagura.services.loader import AsyncContentLoader
+from imagura.services.textures import TextureManager
 from imagura.services.thumbnails import ThumbnailService
+from imagura.settings_persistence import (
+    SETTINGS_EDITABLE_ITEMS,
+    SETTINGS_ITEMS,
+    SETTINGS_TABS,
+    get_settings_item_index,
+    is_editable_item,
+)
+from imagura.state import AppState
 from imagura.state.gallery import GalleryState
+from imagura.state.images import ThumbCache, ThumbQueue
+from imagura.state.input import InputState
 from imagura.state.ui import ContextMenuState, ToolbarState
 from imagura.transforms import flip_image_file, rotate_image_file
 from imagura.types import BitmapThumb, LoadPriority, TextureInfo, ViewParams
 from imagura.ui.context_menu import get_context_menu_item_at
 from imagura.ui.gallery_sort_control import MENU_ITEM_H, MENU_PADDING, _menu_rect, handle_gallery_sort_input
-from imagura.ui.toolbar import get_toolbar_button_at, is_in_toolbar_zone
-from imagura.view_math import clamp_pan, compute_fit_view
+from imagura.ui.toolbar import get_toolbar_button_at, is_in_toolbar_zone, update_toolbar_alpha
+from imagura.view_math import (
+    clamp_pan,
+    compute_fit_view,
+    lerp_view,
+    recompute_view_anchor_zoom,
+    recompute_view_anchor_zoom_clamped,
+)
 from imagura.viewers import get_registry
 from imagura.zoom import (
     ScaleOverlayController,
@@ -57,6 +77,26 @@ def scratch_path(name: str) -> Path:
 
 
 class ViewMathSmokeTests(unittest.TestCase):
+    def test_lerp_view_interpolates_and_clamps(self) -> None:
+        a = ViewParams(scale=1.0, offx=0.0, offy=10.0)
+        b = ViewParams(scale=3.0, offx=100.0, offy=-10.0)
+
+        mid = lerp_view(a, b, 0.5)
+        self.assertEqual((mid.scale, mid.offx, mid.offy), (2.0, 50.0, 0.0))
+        past = lerp_view(a, b, 2.0)
+        self.assertEqual((past.scale, past.offx, past.offy), (3.0, 100.0, -10.0))
+
+        scratch = ViewParams()
+        self.assertIs(lerp_view(a, b, 0.0, out=scratch), scratch)
+        self.assertEqual((scratch.scale, scratch.offx, scratch.offy), (1.0, 0.0, 10.0))
+
+    def test_approach_steps_toward_target_without_overshoot(self) -> None:
+        self.assertEqual(approach(0.0, 1.0, 0.25), 0.25)
+        self.assertEqual(approach(1.0, 0.0, 0.25), 0.75)
+        self.assertEqual(approach(0.9, 1.0, 0.25), 1.0)
+        self.assertEqual(approach(0.1, 0.0, 0.25), 0.0)
+        self.assertEqual(approach(0.5, 0.5, 0.25), 0.5)
+
     def test_compute_fit_view_centers_image(self) -> None:
         view = compute_fit_view(1000, 500, 800, 600, 0.95)
 
@@ -64,6 +104,13 @@ class ViewMathSmokeTests(unittest.TestCase):
         self.assertAlmostEqual(view.offx, 20.0)
         self.assertAlmostEqual(view.offy, 110.0)
 
+    def test_fused_anchor_zoom_matches_zoom_then_clamp(self) -> None:
+        view = ViewParams(scale=1.0, offx=-200.0, offy=50.0)
+        for new_scale, anchor in ((2.5, (400, 300)), (0.3, (10, 590)), (8.0, (799, 0))):
+            expected = clamp_pan(recompute_view_anchor_zoom(view, new_scale, anchor, 1600, 900), 1600, 900, 800, 600)
+            fused = recompute_view_anchor_zoom_clamped(view, new_scale, anchor, 1600, 900, 800, 600)
+            self.assertEqual((fused.scale, fused.offx, fused.offy), (expected.scale, expected.offx, expected.offy))
+
     def test_clamp_pan_keeps_small_image_centered(self) -> None:
         view = clamp_pan(ViewParams(scale=0.5, offx=-1000, offy=-1000), 200, 100, 800, 600)
 
@@ -102,6 +149,17 @@ class ViewerSmokeTests(unittest.TestCase):
         finally:
             viewer.cleanup_cpu_data(img)
 
+    def test_static_viewer_decodes_jpeg_thumbnail_at_reduced_scale(self) -> None:
+        image_path = scratch_path("jpeg-thumb-load") / "large.jpg"
+        Image.new("RGB", (800, 600), (20, 40, 60)).save(image_path)
+
+        viewer = get_registry().get_viewer(str(image_path))
+        img = viewer.load_cpu_thumbnail(str(image_path), 100)
+        try:
+            self.assertEqual((img.width, img.height), (133, 100))
+        finally:
+            viewer.cleanup_cpu_data(img)
+
     def test_gif_viewer_cache_snapshot_survives_runtime_cleanup(self) -> None:
         root = scratch_path("gif-cache-snapshot")
         gif_path = root / "animated.gif"
@@ -179,6 +237,7 @@ class LoaderSmokeTests(unittest.TestCase):
     def test_async_loader_delivers_result_on_poll(self) -> None:
         loader = AsyncContentLoader(lambda path: path.upper(), workers=1)
         events = []
+        processed = 0
 
         try:
             loader.submit(
@@ -189,12 +248,81 @@ class LoaderSmokeTests(unittest.TestCase):
 
             deadline = time.monotonic() + 2.0
             while not events and time.monotonic() < deadline:
-                loader.poll_ui_events()
+                processed += loader.poll_ui_events()
                 time.sleep(0.01)
         finally:
             loader.shutdown()
 
         self.assertEqual(events, [("abc", "ABC", None)])
+        self.assertEqual(processed, 1)
+
+    def test_async_loader_time_budget_leaves_remaining_events_queued(self) -> None:
+        loader = AsyncContentLoader(lambda path: path, workers=1)
+        ran = []
+        try:
+            for name in ("a", "b", "c"):
+                loader.push_ui_event(ran.append, (name,))
+
+            self.assertEqual(loader.poll_ui_events(time_budget_s=0.0), 1)
+            self.assertEqual(ran, ["a"])
+            self.assertEqual(loader.poll_ui_events(), 2)
+            self.assertEqual(ran, ["a", "b", "c"])
+        finally:
+            loader.shutdown()
+
+    def test_async_loader_runs_higher_priority_first_and_shuts_down_idle_workers(self) -> None:
+        started = threading.Event()
+        gate = threading.Event()
+        loaded = []
+
+        def load(path: str) -> str:
+            if path == "busy":
+                started.set()
+                gate.wait(2.0)
+            loaded.append(path)
+            return path
+
+        def noop(path: str, result: object, error: object) -> None:
+            pass
+
+        loader = AsyncContentLoader(load, workers=1)
+        try:
+            loader.submit("busy", LoadPriority.CURRENT, noop)
+            self.assertTrue(started.wait(2.0))
+            loader.submit("thumb", LoadPriority.GALLERY, noop)
+            loader.submit("neighbor", LoadPriority.NEIGHBOR, noop)
+            loader.submit("current", LoadPriority.CURRENT, noop)
+            gate.set()
+
+            deadline = time.monotonic() + 2.0
+            while len(loaded) < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            loader.shutdown()
+
+        self.assertEqual(loaded, ["busy", "current", "neighbor", "thumb"])
+        self.assertFalse(any(worker.is_alive() for worker in loader.workers))
+
+    def test_async_loader_runs_prepare_on_worker(self) -> None:
+        loader = AsyncContentLoader(lambda path: path.upper(), workers=1)
+        events = []
+
+        try:
+            loader.submit(
+                "abc",
+                LoadPriority.GALLERY,
+                lambda path, result, error: events.append((path, result, error)),
+                prepare=lambda result: result + "!",
+            )
+
+            deadline = time.monotonic() + 2.0
+            while not events and time.monotonic() < deadline:
+                loader.poll_ui_events()
+                time.sleep(0.01)
+        finally:
+            loader.shutdown()
+
+        self.assertEqual(events, [("abc", "ABC!", None)])
 
     def test_async_loader_delivers_errors_on_poll(self) -> None:
         def fail(_: str) -> object:
@@ -518,6 +646,42 @@ class ExifMetadataCacheSmokeTests(unittest.TestCase):
         self.assertEqual(cache.get(str(second)), {})
         self.assertEqual(cache.cached_paths(), [str(second)])
 
+    def test_reads_camera_and_date_tags(self) -> None:
+        path = scratch_path("metadata-tags") / "tagged.jpg"
+        exif = Image.Exif()
+        exif[0x0110] = "Camera X "
+        exif.get_ifd(0x8769)[0x9003] = "2024:01:02 03:04:05"
+        Image.new("RGB", (2, 2), (0, 0, 255)).save(path, exif=exif)
+
+        metadata = ExifMetadataCache().get(str(path))
+
+        self.assertEqual(metadata["camera"], "Camera X")
+        self.assertEqual(metadata["date"], "2024-01-02 03:04")
+
+    def test_request_reads_metadata_on_loader_worker(self) -> None:
+        path = scratch_path("metadata-async") / "tagged.jpg"
+        exif = Image.Exif()
+        exif[0x0110] = "Camera Y"
+        Image.new("RGB", (2, 2), (0, 0, 255)).save(path, exif=exif)
+
+        cache = ExifMetadataCache()
+        ready = []
+        loader = AsyncContentLoader(lambda _: self.fail("image loader used for metadata"), workers=1)
+        try:
+            cache.request(str(path), loader, ready.append)
+            cache.request(str(path), loader, ready.append)
+            self.assertIsNone(cache.peek(str(path)))
+
+            deadline = time.monotonic() + 2.0
+            while not ready and time.monotonic() < deadline:
+                loader.poll_ui_events()
+                time.sleep(0.01)
+        finally:
+            loader.shutdown()
+
+        self.assertEqual(ready, [str(path)])
+        self.assertEqual(cache.peek(str(path)), {"camera": "Camera Y"})
+
 
 class ThumbnailSmokeTests(unittest.TestCase):
     def test_thumbnail_service_schedules_and_processes_budgeted_items(self) -> None:
@@ -525,8 +689,8 @@ class ThumbnailSmokeTests(unittest.TestCase):
             def __init__(self) -> None:
                 self.submitted = []
 
-            def submit(self, path, priority, callback) -> None:
-                self.submitted.append((path, priority, callback))
+            def submit(self, path, priority, callback, prepare=None, load=None) -> None:
+                self.submitted.append((path, priority, callback, prepare))
 
         class FakeTextureManager:
             def build_thumbnail(self, loaded, target_h, path):
@@ -557,10 +721,76 @@ class ThumbnailSmokeTests(unittest.TestCase):
             self.assertEqual(state.async_loader.submitted[0][0], "img-1.png")
             self.assertEqual(state.async_loader.submitted[0][1], LoadPriority.GALLERY)
             self.assertIn("img-1.png", state.thumb_cache)
+
+            class FakeViewer:
+                def prepare_thumbnail(self, cpu_data, target_h):
+                    return (cpu_data, target_h)
+
+            viewer = FakeViewer()
+            prepare = state.async_loader.submitted[0][3]
+            target_h = int(service.gallery_height(state.screenH) * 0.8)
+            self.assertEqual(prepare((viewer, "cpu")), (viewer, ("cpu", target_h)))
         finally:
             config.THUMB_PRELOAD_SPAN = old_span
             config.THUMB_BUILD_BUDGET_PER_FRAME = old_budget
 
+    def test_thumbnail_schedule_drops_queued_paths_outside_window(self) -> None:
+        state = type("State", (), {})()
+        state.current_dir_images = [f"img-{idx}.png" for idx in range(5)]
+        state.thumb_queue = ThumbQueue()
+        state.thumb_cache = OrderedDict()
+
+        old_span = config.THUMB_PRELOAD_SPAN
+        try:
+            config.THUMB_PRELOAD_SPAN = 1
+            service = ThumbnailService(None)
+            service.schedule_around(state, 2)
+            service.schedule_around(state, 4)
+            self.assertEqual(list(state.thumb_queue), ["img-3.png", "img-4.png"])
+            self.assertNotIn("img-1.png", state.thumb_queue)
+        finally:
+            config.THUMB_PRELOAD_SPAN = old_span
+
+    def test_thumbnail_service_evicts_to_byte_cap(self) -> None:
+        class FakeTextureManager:
+            def __init__(self) -> None:
+                self.unloaded = []
+
+            def unload_texture(self, tex) -> None:
+                self.unloaded.append(tex)
+
+        state = type("State", (), {})()
+        state.thumb_cache = ThumbCache()
+        # 1024x256 RGBA = 1 MB per thumb
+        for p in "abc":
+            state.thumb_cache[p] = BitmapThumb(texture=f"tex-{p}", size=(1024, 256), src_path=p, ready=True)
+        state.thumb_cache["pending"] = BitmapThumb(None, (0, 0), "pending", False)
+        self.assertEqual(state.thumb_cache.nbytes, 3 * 1024 * 1024)
+
+        old_mb = config.THUMB_CACHE_MAX_MB
+        manager = FakeTextureManager()
+        try:
+            config.THUMB_CACHE_MAX_MB = 2
+            ThumbnailService(manager).enforce_cache_limit(state)
+        finally:
+            config.THUMB_CACHE_MAX_MB = old_mb
+
+        self.assertEqual(manager.unloaded, ["tex-a"])
+        self.assertEqual(list(state.thumb_cache), ["b", "c", "pending"])
+        self.assertEqual(state.thumb_cache.nbytes, 2 * 1024 * 1024)
+
+    def test_thumb_queue_dedupes_and_tracks_membership(self) -> None:
+        queue = ThumbQueue(["a", "b"])
+        queue.append("a")
+        self.assertEqual(list(queue), ["a", "b"])
+
+        self.assertEqual(queue.popleft(), "a")
+        self.assertNotIn("a", queue)
+        self.assertIn("b", queue)
+
+        queue.clear()
+        self.assertEqual(len(queue), 0)
+
     def test_thumbnail_service_evicts_via_texture_manager(self) -> None:
         class FakeTextureManager:
             def __init__(self) -> None:
@@ -588,6 +818,37 @@ class ThumbnailSmokeTests(unittest.TestCase):
             config.THUMB_CACHE_LIMIT = old_limit
 
 
+    def test_thumbnail_service_schedule_refreshes_lru_order(self) -> None:
+        class FakeTextureManager:
+            def __init__(self) -> None:
+                self.unloaded = []
+
+            def unload_texture(self, tex) -> None:
+                self.unloaded.append(tex)
+
+        state = type("State", (), {})()
+        state.current_dir_images = ["a", "b", "c"]
+        state.thumb_queue = __import__("collections").deque()
+        state.thumb_cache = __import__("collections").OrderedDict(
+            (p, BitmapThumb(texture=f"tex-{p}", size=(1, 1), src_path=p, ready=True)) for p in "abc"
+        )
+
+        old_span = config.THUMB_PRELOAD_SPAN
+        old_limit = config.THUMB_CACHE_LIMIT
+        manager = FakeTextureManager()
+        try:
+            config.THUMB_PRELOAD_SPAN = 0
+            config.THUMB_CACHE_LIMIT = 2
+            service = ThumbnailService(manager)
+            service.schedule_around(state, 0)
+            service.enforce_cache_limit(state)
+            self.assertEqual(manager.unloaded, ["tex-b"])
+            self.assertEqual(list(state.thumb_cache.keys()), ["c", "a"])
+        finally:
+            config.THUMB_PRELOAD_SPAN = old_span
+            config.THUMB_CACHE_LIMIT = old_limit
+
+
 class GalleryBehaviorSmokeTests(unittest.TestCase):
     def _state(self):
         state = type("State", (), {})()
@@ -678,6 +939,38 @@ class UIControlsSmokeTests(unittest.TestCase):
         self.assertEqual(get_toolbar_button_at(state, first_x, y), 0)
         self.assertEqual(get_toolbar_button_at(state, 0, state.screenH), -1)
 
+    def test_toolbar_layout_follows_screen_width(self) -> None:
+        state = SimpleNamespace(screenW=1000, screenH=800, ui=SimpleNamespace(toolbar=ToolbarState()))
+        state.ui.toolbar.alpha = 1.0
+        y = config.TOOLBAR_HEIGHT // 2
+        narrow_x = next(x for x in range(1000) if get_toolbar_button_at(state, x, y) == 0)
+
+        state.screenW = 1400
+        wide_x = next(x for x in range(1400) if get_toolbar_button_at(state, x, y) == 0)
+
+        self.assertEqual(wide_x - narrow_x, 200)
+
+    def test_frame_step_is_clamped_after_skipped_frames(self) -> None:
+        import imagura2
+
+        state = AppState()
+        state.screenW = 1000
+        state.screenH = 1000
+        state.gallery_y = 1000
+        state.input.mouse_y = 990
+        state.ui.toolbar.target_alpha = 1.0
+
+        # A second of idle skipping shows up as one huge GetFrameTime spike.
+        imagura2.note_skipped_frame(state)
+        for _ in range(2):
+            self.assertLessEqual(imagura2.update_frame_dt(state, 1.5), 1.0 / imagura2.TARGET_FPS)
+            imagura2.update_gallery_visibility_and_slide(state)
+            update_toolbar_alpha(state)
+
+        self.assertGreater(state.gallery_y, 1000 - imagura2.get_gallery_height(state.screenH))
+        self.assertLess(state.ui.toolbar.alpha, 1.0)
+        self.assertEqual(imagura2.update_frame_dt(state, 1.5), 1.5)
+
     def test_context_menu_hit_testing_clamps_to_screen(self) -> None:
         state = SimpleNamespace(screenW=200, screenH=160, ui=SimpleNamespace(context_menu=ContextMenuState()))
         state.ui.context_menu.show(190, 150)
@@ -707,6 +1000,17 @@ class UIControlsSmokeTests(unittest.TestCase):
         self.assertEqual(state.gallery.sort_key, "modified")
         self.assertFalse(state.gallery.sort_menu_open)
 
+    def test_double_click_needs_nearby_second_click_within_window(self) -> None:
+        inp = InputState()
+        window = config.DOUBLE_CLICK_TIME_MS / 1000.0
+
+        self.assertFalse(inp.check_double_click(100, 100, t=10.0))
+        self.assertTrue(inp.check_double_click(104, 103, t=10.0 + window / 2))
+        # A third click starts a new pair instead of counting as another double.
+        self.assertFalse(inp.check_double_click(104, 103, t=10.0 + window * 0.75))
+        self.assertFalse(inp.check_double_click(300, 103, t=10.0 + window))
+        self.assertEqual(inp.last_click_pos, (300, 103))
+
 
 class AnimatedPlaybackSmokeTests(unittest.TestCase):
     def test_stop_cleans_current_playback(self) -> None:
@@ -890,6 +1194,19 @@ class UserSettingsSmokeTests(unittest.TestCase):
             config.TARGET_FPS = old_config_value
             imagura2.TARGET_FPS = old_global_value
 
+    def test_editable_item_tables_skip_headers(self) -> None:
+        for tab, editable in zip(SETTINGS_TABS, SETTINGS_EDITABLE_ITEMS):
+            self.assertEqual(editable, [item for item in tab["items"] if is_editable_item(item)])
+
+        editable_idx = 0
+        for visual_idx, item in enumerate(SETTINGS_ITEMS):
+            if is_editable_item(item):
+                self.assertEqual(get_settings_item_index(visual_idx), editable_idx)
+                editable_idx += 1
+            else:
+                self.assertEqual(get_settings_item_index(visual_idx), -1)
+        self.assertEqual(get_settings_item_index(len(SETTINGS_ITEMS)), -1)
+
 
 class WindowFlagSmokeTests(unittest.TestCase):
     def test_fullscreen_flags_request_transparent_framebuffer(self) -> None:
@@ -1117,5 +1434,32 @@ class TextureTypeSmokeTests(unittest.TestCase):
         self.assertEqual((copied.w, copied.h, copied.path), (10, 20, "x.png"))
 
 
+    def test_deferred_unload_waits_two_frames(self) -> None:
+        class CountingTextureManager(TextureManager):
+            def __init__(self) -> None:
+                self.unloaded = []
+
+            def unload_texture(self, tex) -> None:
+                self.unloaded.append(tex)
+
+        manager = CountingTextureManager()
+        state = SimpleNamespace(to_unload=[])
+        tex = SimpleNamespace(id=7)
+        saved_frame = get_frame()
+        try:
+            set_frame(10)
+            manager.defer_unload(state, TextureInfo(tex=tex, w=1, h=1, path="x.png"))
+            set_frame(11)
+            manager.process_deferred_unloads(state)
+            self.assertEqual(manager.unloaded, [])
+            set_frame(12)
+            manager.process_deferred_unloads(state)
+        finally:
+            set_frame(saved_frame)
+
+        self.assertEqual(manager.unloaded, [tex])
+        self.assertEqual(state.to_unload, [])
+
+
 if __name__ == "__main__":
     unittest.main()